@@ -279,8 +279,17 @@ def dialects(**kwargs):
     is_flag=True,
     help=("Perform the operation regardless of .sqlfluffignore configurations"),
 )
+@click.option(
+    "-p",
+    "--parallel",
+    type=int,
+    default=1,
+    help="The number of processes to lint files in (default=1).",
+)
 @click.argument("paths", nargs=-1)
-def lint(paths, format, nofail, disregard_sqlfluffignores, logger=None, **kwargs):
+def lint(
+    paths, format, nofail, disregard_sqlfluffignores, parallel=1, logger=None, **kwargs
+):
     """Lint SQL files via passing a list of files or using stdin.
 
     PATH is the path to a sql file or directory to lint. This can be either a
@@ -321,6 +330,7 @@ def lint(paths, format, nofail, disregard_sqlfluffignores, logger=None, **kwargs
                 paths,
                 ignore_non_existent_files=False,
                 ignore_files=not disregard_sqlfluffignores,
+                parallel=parallel,
             )
         except IOError:
             click.echo(
@@ -383,9 +393,23 @@ def do_fixes(lnt, result, formatter=None, **kwargs):
         "Disable the safety of requiring --rules to be specified. **Use this with caution.**"
     ),
 )
+@click.option(
+    "-p",
+    "--parallel",
+    type=int,
+    default=1,
+    help="The number of processes to lint files in (default=1).",
+)
 @click.argument("paths", nargs=-1)
 def fix(
-    force, paths, bench=False, fixed_suffix="", no_safety=False, logger=None, **kwargs
+    force,
+    paths,
+    bench=False,
+    fixed_suffix="",
+    no_safety=False,
+    parallel=1,
+    logger=None,
+    **kwargs
 ):
     """Fix SQL files.
 
@@ -438,7 +462,9 @@ def fix(
     # Lint the paths (not with the fix argument at this stage), outputting as we go.
     click.echo("==== finding fixable violations ====")
     try:
-        result = lnt.lint_paths(paths, fix=True, ignore_non_existent_files=False)
+        result = lnt.lint_paths(
+            paths, fix=True, ignore_non_existent_files=False, parallel=parallel
+        )
     except IOError:
         click.echo(
             colorize(
@@ -52,11 +52,11 @@ def format_violation(violation, max_line_length=90):
     if isinstance(violation, SQLBaseError):
         code, line, pos, desc = violation.get_info_tuple()
         if line is not None:
-            line_elem = "{0:4d}".format(line)
+            line_elem = f"{line:4d}"
         else:
             line_elem = "   -"
         if pos is not None:
-            pos_elem = "{0:4d}".format(pos)
+            pos_elem = f"{pos:4d}"
         else:
             pos_elem = "   -"
     else:
@@ -66,23 +66,20 @@ def format_violation(violation, max_line_length=90):
         desc = "IGNORE: " + desc
 
     split_desc = split_string_on_spaces(desc, line_length=max_line_length - 25)
+    # Grey out the violation if we're ignoring it.
+    color = "lightgrey" if violation.ignore else "blue"
 
-    out_buff = ""
+    # Collect the pieces and join once at the end.
+    out_buff = []
     for idx, line in enumerate(split_desc):
         if idx == 0:
-            out_buff += colorize(
-                "L:{0} | P:{1} | {2} | ".format(line_elem, pos_elem, code.rjust(4)),
-                # Grey out the violation if we're ignoring it.
-                "lightgrey" if violation.ignore else "blue",
+            out_buff.append(
+                colorize(f"L:{line_elem} | P:{pos_elem} | {code:>4} | ", color)
             )
         else:
-            out_buff += (
-                "\n"
-                + (" " * 23)
-                + colorize("| ", "lightgrey" if violation.ignore else "blue")
-            )
-        out_buff += line
-    return out_buff
+            out_buff.append("\n" + (" " * 23) + colorize("| ", color))
+        out_buff.append(line)
+    return "".join(out_buff)
 
 
 def format_linting_stats(result, verbose=0):
@@ -284,29 +281,25 @@ class CallbackFormatter:
 
     def _format_file_violations(self, fname, violations):
         """Format a set of violations in a `LintingResult`."""
-        text_buffer = StringIO()
+        # Collect lines and join them at the end, which also means
+        # we don't have a trailing newline to remove.
+        text_buffer = []
         # Success is having no violations (which aren't ignored)
-        success = sum(int(not violation.ignore) for violation in violations) == 0
+        success = all(violation.ignore for violation in violations)
 
         # Only print the filename if it's either a failure or verbosity > 1
         if self._verbosity > 1 or not success:
-            text_buffer.write(format_filename(fname, success=success))
-            text_buffer.write("\n")
+            text_buffer.append(format_filename(fname, success=success))
 
         # If we have violations, print them
         if not success:
             # sort by position in file
             s = sorted(violations, key=lambda v: v.char_pos())
-            for violation in s:
-                text_buffer.write(
-                    format_violation(violation, max_line_length=self.output_line_length)
-                )
-                text_buffer.write("\n")
-        str_buffer = text_buffer.getvalue()
-        # Remove the trailing newline if there is one
-        if len(str_buffer) > 0 and str_buffer[-1] == "\n":
-            str_buffer = str_buffer[:-1]
-        return str_buffer
+            text_buffer.extend(
+                format_violation(violation, max_line_length=self.output_line_length)
+                for violation in s
+            )
+        return "\n".join(text_buffer)
 
     def dispatch_file_violations(self, fname, linted_file, only_fixable):
         """Dispatch any violations found in a file."""
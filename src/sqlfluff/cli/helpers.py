@@ -109,6 +109,13 @@ def cli_table_row(
     ]
     max_lines = max(fld["lines"] for fld in wrapped_fields)
     last_line_idx = max_lines - 1
+    # Look up the colour tags once, and write them to the buffer
+    # directly rather than building each coloured label first.
+    if label_color:
+        start_tag = color_lookup[label_color]
+        end_tag = Style.RESET_ALL
+    else:
+        start_tag = end_tag = ""
     # Make some text
     buff = StringIO()
     for line_idx in range(max_lines):
@@ -117,15 +124,14 @@ def cli_table_row(
             fld = wrapped_fields[col_idx]
             ll = fld["label_list"]
             vl = fld["val_list"]
+            buff.write(start_tag)
             buff.write(
-                colorize(
-                    pad_line(
-                        ll[line_idx] if line_idx < len(ll) else "",
-                        width=fld["label_width"],
-                    ),
-                    color=label_color,
+                pad_line(
+                    ll[line_idx] if line_idx < len(ll) else "",
+                    width=fld["label_width"],
                 )
             )
+            buff.write(end_tag)
             if line_idx == 0:
                 buff.write(sep_char)
             else:
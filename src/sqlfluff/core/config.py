@@ -369,6 +369,32 @@ class FluffConfig:
             self._configs["core"]["templater"]
         )
 
+    def __getstate__(self):
+        # The dialect and templater objects can't be pickled (which we need
+        # to do when linting in parallel), so we leave them out and select
+        # them again when unpickling.
+        state = self.__dict__.copy()
+        state["_configs"] = self._configs.copy()
+        state["_configs"]["core"] = {
+            k: v
+            for k, v in self._configs["core"].items()
+            if k not in ("dialect_obj", "templater_obj")
+        }
+        return state
+
+    def __setstate__(self, state):
+        # NB: We import here to avoid a circular references.
+        from .dialects import dialect_selector
+        from .templaters import templater_selector
+
+        self.__dict__.update(state)
+        self._configs["core"]["dialect_obj"] = dialect_selector(
+            self._configs["core"]["dialect"]
+        )
+        self._configs["core"]["templater_obj"] = templater_selector(
+            self._configs["core"]["templater"]
+        )
+
     @classmethod
     def from_root(cls, overrides: Optional[dict] = None) -> "FluffConfig":
         """Loads a config object just based on the root directory."""
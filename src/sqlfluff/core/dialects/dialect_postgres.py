@@ -9,6 +9,7 @@ from ..parser import (
     BaseSegment,
     NamedSegment,
     Delimited,
+    SegmentGenerator,
 )
 
 from .dialect_ansi import ansi_dialect
@@ -26,11 +27,13 @@ postgres_dialect.patch_lexer_struct(
 
 postgres_dialect.insert_lexer_struct(
     # JSON Operators: https://www.postgresql.org/docs/9.5/functions-json.html
+    # NB: Regex alternation takes the first option which matches rather than
+    # the longest, so any operator must come before those which prefix it.
     [
         (
             "json_operator",
             "regex",
-            r"->>|#>>|->|#>|@>|<@|\?\||\?|\?&|#-",
+            r"->>|#>>|->|#>|#-|@>|<@|\?\||\?&|\?",
             dict(is_code=True),
         )
     ],
@@ -51,20 +54,26 @@ postgres_dialect.add(
 
 
 postgres_dialect.replace(
-    PostFunctionGrammar=OneOf(
-        Ref("WithinGroupClauseSegment"),
-        Sequence(
-            Sequence(OneOf("IGNORE", "RESPECT"), "NULLS", optional=True),
-            Ref("OverClauseSegment"),
-        ),
+    # These grammars are generated lazily, so that they're only
+    # built if the postgres dialect is actually used.
+    PostFunctionGrammar=SegmentGenerator(
+        lambda dialect: OneOf(
+            Ref("WithinGroupClauseSegment"),
+            Sequence(
+                Sequence(OneOf("IGNORE", "RESPECT"), "NULLS", optional=True),
+                Ref("OverClauseSegment"),
+            ),
+        )
     ),
-    BinaryOperatorGramar=OneOf(
-        Ref("ArithmeticBinaryOperatorGrammar"),
-        Ref("StringBinaryOperatorGrammar"),
-        Ref("BooleanBinaryOperatorGrammar"),
-        Ref("ComparisonOperatorGrammar"),
-        # Add JSON operators
-        Ref("JsonOperatorSegment"),
+    BinaryOperatorGramar=SegmentGenerator(
+        lambda dialect: OneOf(
+            Ref("ArithmeticBinaryOperatorGrammar"),
+            Ref("StringBinaryOperatorGrammar"),
+            Ref("BooleanBinaryOperatorGrammar"),
+            Ref("ComparisonOperatorGrammar"),
+            # Add JSON operators
+            Ref("JsonOperatorSegment"),
+        )
     ),
 )
 
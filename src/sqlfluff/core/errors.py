@@ -166,7 +166,8 @@ class SQLParseError(SQLBaseError):
         segment (:obj:`BaseSegment`, optional): The segment which is relevant
             for the failure in parsing. This is likely to be a subclass of
             `BaseSegment` rather than the parent class itself. This is mostly
-            used for logging and for referencing position.
+            used for logging and for referencing position. If no message is
+            given, this is taken to be an unparsable section.
 
     """
 
@@ -178,6 +179,25 @@ class SQLParseError(SQLBaseError):
         self.segment = kwargs.pop("segment", None)
         super(SQLParseError, self).__init__(*args, **kwargs)
 
+    def desc(self):
+        """Fetch a description of this violation.
+
+        If there's no message, but there is a segment, then the segment
+        is an unparsable section. We describe it here rather than when
+        the error is created, because most of them are never displayed.
+        """
+        if not self.args and self.segment is not None:
+            raw = self.segment.raw
+            return "Found unparsable section: {0!r}".format(
+                raw if len(raw) < 40 else raw[:40] + "..."
+            )
+        return super(SQLParseError, self).desc()
+
+    def __str__(self):
+        if not self.args:
+            return self.desc()
+        return super(SQLParseError, self).__str__()
+
 
 class SQLLintError(SQLBaseError):
     """An error which occured during linting.
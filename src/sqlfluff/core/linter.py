@@ -1,8 +1,13 @@
 """Defines the linter class."""
 
+import copy
+import hashlib
+import itertools
 import os
 import time
-from collections import namedtuple
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import logging
 
 # Attempt to use the C version for a speedup on comparisons
@@ -17,23 +22,38 @@ import pathspec
 
 from .errors import SQLLexError, SQLParseError
 from .parser import Lexer, Parser
-from .rules import get_ruleset
+from .rules import get_ruleset, crawl_rules
 from .config import FluffConfig, ConfigLoader
 
 
 # Instantiate the linter logger
 linter_logger = logging.getLogger("sqlfluff.linter")
 
+# The linter for each worker process when linting in parallel.
+_worker_linter = None
 
-class LintedFile(
-    namedtuple(
-        "ProtoFile",
-        ["path", "violations", "time_dict", "tree", "file_mask", "ignore_mask"],
-    )
-):
-    """A class to store the idea of a linted file."""
 
-    __slots__ = ()
+class LintedFile:
+    """A class to store the idea of a linted file.
+
+    The fields are read a lot when results for many files are
+    aggregated, so they live in `__slots__`.
+    """
+
+    __slots__ = "path", "violations", "time_dict", "tree", "file_mask", "ignore_mask"
+
+    def __init__(self, path, violations, time_dict, tree, file_mask, ignore_mask):
+        self.path = path
+        self.violations = violations
+        self.time_dict = time_dict
+        self.tree = tree
+        self.file_mask = file_mask
+        self.ignore_mask = ignore_mask
+
+    def __repr__(self):
+        return "<LintedFile: {0!r}, #violations: {1}>".format(
+            self.path, len(self.violations)
+        )
 
     def check_tuples(self):
         """Make a list of check_tuples.
@@ -411,7 +431,7 @@ class LintedPath:
         else:
             tuple_buffer = []
             for file in self.files:
-                tuple_buffer += file.check_tuples()
+                tuple_buffer.extend(file.check_tuples())
             return tuple_buffer
 
     def num_violations(self, **kwargs):
@@ -422,7 +442,7 @@ class LintedPath:
         """Return a list of violations in the path."""
         buff = []
         for file in self.files:
-            buff += file.get_violations(**kwargs)
+            buff.extend(file.get_violations(**kwargs))
         return buff
 
     def violation_dict(self, **kwargs):
@@ -503,7 +523,7 @@ class LintingResult:
         else:
             tuple_buffer = []
             for path in self.paths:
-                tuple_buffer += path.check_tuples()
+                tuple_buffer.extend(path.check_tuples())
             return tuple_buffer
 
     def num_violations(self, **kwargs):
@@ -514,12 +534,14 @@ class LintingResult:
         """Return a list of violations in the result."""
         buff = []
         for path in self.paths:
-            buff += path.get_violations(**kwargs)
+            buff.extend(path.get_violations(**kwargs))
         return buff
 
     def violation_dict(self, **kwargs):
         """Return a dict of paths and violations."""
-        return self.combine_dicts(path.violation_dict(**kwargs) for path in self.paths)
+        return self.combine_dicts(
+            *(path.violation_dict(**kwargs) for path in self.paths)
+        )
 
     def stats(self):
         """Return a stats dictionary of this result."""
@@ -552,7 +574,7 @@ class LintingResult:
                 "filepath": path,
                 "violations": sorted(
                     # Sort violations by line and then position
-                    [v.get_info_dict() for v in violations],
+                    (v.get_info_dict() for v in violations),
                     # The tuple allows sorting by line number, then position, then code
                     key=lambda v: (v["line_no"], v["line_pos"], v["code"]),
                 ),
@@ -588,6 +610,13 @@ class LintingResult:
 class Linter:
     """The interface class to interact with the linter."""
 
+    # The maximum number of parsed files to keep in the parse cache. This
+    # is mostly for reparsing the same file (e.g. after fixing it), so it
+    # only needs to be small, and each entry holds a whole parse tree.
+    parse_cache_size = 16
+    # How many files to read ahead of the one being linted or parsed.
+    read_ahead = 8
+
     def __init__(
         self,
         sql_exts=(".sql",),
@@ -609,21 +638,54 @@ class Linter:
         self.formatter = formatter
         # Store references to user rule classes
         self.user_rules = user_rules or []
+        # Cache of instantiated rules for each config object. It's weakly
+        # keyed so that the rules for each per-file config are dropped
+        # along with the config.
+        self._ruleset_cache = weakref.WeakKeyDictionary()
+        # Cache of parse results, keyed on a digest of the templated string
+        # and the config which affects lexing and parsing. Least recently
+        # used first.
+        self._parse_cache = OrderedDict()
 
     def get_ruleset(self, config=None):
-        """Get hold of a set of rules."""
+        """Get hold of a set of rules.
+
+        The rules are only instantiated once for each config object.
+        """
+        cfg = config or self.config
+        try:
+            return self._ruleset_cache[cfg]
+        except KeyError:
+            pass
         rs = get_ruleset()
         # Register any user rules
         for rule in self.user_rules:
             rs.register(rule)
-        cfg = config or self.config
-        return rs.get_rulelist(config=cfg)
+        rulelist = rs.get_rulelist(config=cfg)
+        self._ruleset_cache[cfg] = rulelist
+        return rulelist
 
     def rule_tuples(self):
         """A simple pass through to access the rule tuples of the rule set."""
         rs = self.get_ruleset()
         return [(rule.code, rule.description) for rule in rs]
 
+    @staticmethod
+    def _parse_cache_key(s, config, recurse):
+        """Get the key for the parse cache of a templated string.
+
+        We use a digest of the string rather than the string itself, so
+        the cache doesn't keep every source file alive.
+        """
+        indentation_config = config.get_section("indentation") or {}
+        return (
+            hashlib.blake2b(s.encode("utf-8"), digest_size=16).hexdigest(),
+            config.get("dialect_obj").name,
+            recurse,
+            config.get("recurse"),
+            tuple(sorted(indentation_config.items())),
+        )
+
     def parse_string(self, s, fname=None, recurse=True, config=None):
         """Parse a string.
 
@@ -665,6 +727,23 @@ class Linter:
         t1 = time.monotonic()
         bencher("Templating {0!r}".format(short_fname))
 
+        # If we've parsed this exact templated string before then reuse
+        # the result. Segments aren't mutated once parsed so the tree can
+        # be shared, but violations can be so we copy those.
+        cache_key = None
+        if s:
+            cache_key = self._parse_cache_key(s, config or self.config, recurse)
+        if cache_key in self._parse_cache:
+            linter_logger.info("USING CACHED PARSE (%s)", fname)
+            self._parse_cache.move_to_end(cache_key)
+            parsed, parse_violations = self._parse_cache[cache_key]
+            violations += [copy.copy(v) for v in parse_violations]
+            t2 = time.monotonic()
+            time_dict = {"templating": t1 - t0, "lexing": 0.0, "parsing": t2 - t1}
+            bencher("Finish parsing {0!r}".format(short_fname))
+            return parsed, violations, time_dict
+        num_templater_violations = len(violations)
+
         if s:
             linter_logger.info("LEXING RAW (%s)", fname)
             # Get the lexer
@@ -680,7 +759,11 @@ class Linter:
         else:
             tokens = None
 
-        if tokens:
+        # Some of the logging below is expensive to build, so only do it
+        # if anyone is listening.
+        log_info = linter_logger.isEnabledFor(logging.INFO)
+
+        if tokens and log_info:
             linter_logger.info("Lexed tokens: %s", [seg.raw for seg in tokens])
 
         t2 = time.monotonic()
@@ -695,27 +778,29 @@ class Linter:
                 violations.append(err)
                 parsed = None
             if parsed:
-                linter_logger.info("\n###\n#\n# {0}\n#\n###".format("Parsed Tree:"))
-                linter_logger.info("\n" + parsed.stringify())
+                if log_info:
+                    linter_logger.info("\n###\n#\n# {0}\n#\n###".format("Parsed Tree:"))
+                    linter_logger.info("\n" + parsed.stringify())
                 # We may succeed parsing, but still have unparsable segments. Extract them here.
                 for unparsable in parsed.iter_unparsables():
                     # No exception has been raised explicitly, but we still create one here
-                    # so that we can use the common interface
-                    violations.append(
-                        SQLParseError(
-                            "Found unparsable section: {0!r}".format(
-                                unparsable.raw
-                                if len(unparsable.raw) < 40
-                                else unparsable.raw[:40] + "..."
-                            ),
-                            segment=unparsable,
-                        )
-                    )
-                    linter_logger.info("Found unparsable segment...")
-                    linter_logger.info(unparsable.stringify())
+                    # so that we can use the common interface. The message is only
+                    # built from the segment if it's needed.
+                    violations.append(SQLParseError(segment=unparsable))
+                    if log_info:
+                        linter_logger.info("Found unparsable segment...")
+                        linter_logger.info(unparsable.stringify())
         else:
             parsed = None
 
+        if cache_key:
+            self._parse_cache[cache_key] = (
+                parsed,
+                [copy.copy(v) for v in violations[num_templater_violations:]],
+            )
+            if len(self._parse_cache) > self.parse_cache_size:
+                self._parse_cache.popitem(last=False)
+
         t3 = time.monotonic()
         time_dict = {"templating": t1 - t0, "lexing": t2 - t1, "parsing": t3 - t2}
         bencher("Finish parsing {0!r}".format(short_fname))
@@ -745,11 +830,10 @@ class Linter:
     def lint(self, parsed, config=None):
         """Lint a parsed file object."""
         config = config or self.config
-        linting_errors = []
-        for crawler in self.get_ruleset(config=config):
-            lerrs, _, _, _ = crawler.crawl(parsed, dialect=config.get("dialect_obj"))
-            linting_errors += lerrs
-        return linting_errors
+        # All the rules are evaluated in a single pass over the tree.
+        return crawl_rules(
+            self.get_ruleset(config=config), parsed, dialect=config.get("dialect_obj")
+        )
 
     def fix(self, parsed, config=None):
         """Fix a parsed file object."""
@@ -765,6 +849,12 @@ class Linter:
         fix_loop_idx = 0
         # How many loops are we allowed
         loop_limit = config.get("runaway_limit")
+        # The rules don't change between loops, so only fetch them once.
+        ruleset = self.get_ruleset(config=config)
+        # For each rule which found nothing to fix, the tree it checked.
+        # Rules are deterministic, so there's no need to run them again
+        # until the tree has changed.
+        clean_trees = {}
         # Enter into the main fix loop. Some fixes may introduce other
         # problems and so we loop around this until we reach stability
         # or we reach the limit.
@@ -772,7 +862,9 @@ class Linter:
             fix_loop_idx += 1
             changed = False
             # Iterate through each rule.
-            for crawler in self.get_ruleset(config=config):
+            for crawler in ruleset:
+                if clean_trees.get(crawler) is working:
+                    continue
                 # fixes should be a dict {} with keys edit, delete, create
                 # delete is just a list of segments to delete
                 # edit and create are list of tuples. The first element is the
@@ -807,6 +899,8 @@ class Linter:
                             "One fix for %s not applied, it would re-cause the same error.",
                             crawler.code,
                         )
+                else:
+                    clean_trees[crawler] = working
             # We did not change the file. Either the file is clean (no fixes), or
             # any fixes which are present will take us back to a previous state.
             if not changed:
@@ -889,21 +983,25 @@ class Linter:
         linted_file = LintedFile(
             fname, vs, time_dict, parsed, file_mask=file_mask, ignore_mask=ignore_buff
         )
+        self._dispatch_linted_file(linted_file, fix=fix, config=config)
+        return linted_file
+
+    def _dispatch_linted_file(self, linted_file, fix=False, config=None):
+        """Output the result of linting a file using the formatter (if present)."""
+        if not self.formatter:
+            return
+        config = config or self.config
 
         # This is the main command line output from linting.
-        if self.formatter:
-            self.formatter.dispatch_file_violations(
-                fname, linted_file, only_fixable=fix
-            )
+        self.formatter.dispatch_file_violations(
+            linted_file.path, linted_file, only_fixable=fix
+        )
 
         # Safety flag for unset dialects
         if config.get("dialect") == "ansi" and linted_file.get_violations(
             fixable=True if fix else None, types=SQLParseError
         ):
-            if self.formatter:
-                self.formatter.dispatch_dialect_warning()
-
-        return linted_file
+            self.formatter.dispatch_dialect_warning()
 
     def paths_from_path(
         self,
@@ -929,7 +1027,7 @@ class Linter:
             if ignore_non_existent_files:
                 return []
             else:
-                raise IOError("Specified path does not exist")
+                raise FileNotFoundError("Specified path does not exist")
 
         # Files referred to exactly are also ignored if
         # matched, but we warn the users when that happens
@@ -964,6 +1062,7 @@ class Linter:
         # If it's a directory then expand the path!
         buffer = []
         ignore_set = set()
+        sql_exts = tuple(self.sql_exts)
         for dirpath, _, filenames in path_walk:
             for fname in filenames:
                 fpath = os.path.join(dirpath, fname)
@@ -981,11 +1080,9 @@ class Linter:
                 # We won't purge files *here* because there's an edge case
                 # that the ignore file is processed after the sql file.
 
-                # Scan for remaining files
-                for ext in self.sql_exts:
-                    # is it a sql file?
-                    if fname.endswith(ext):
-                        buffer.append(fpath)
+                # Scan for remaining files, is it a sql file?
+                if fname.endswith(sql_exts):
+                    buffer.append(fpath)
 
         if not ignore_files:
             return sorted(buffer)
@@ -1027,30 +1124,85 @@ class Linter:
         linted_path = LintedPath(path)
         if self.formatter:
             self.formatter.dispatch_path(path)
-        for fname in self.paths_from_path(
+        fnames = self.paths_from_path(
             path,
             ignore_non_existent_files=ignore_non_existent_files,
             ignore_files=ignore_files,
-        ):
+        )
+        for fname, in_str in self._read_files(fnames):
             config = self.config.make_child_from_path(fname)
-            # Handle unicode issues gracefully
-            with open(
-                fname, "r", encoding="utf8", errors="backslashreplace"
-            ) as target_file:
-                linted_path.add(
-                    self.lint_string(
-                        target_file.read(), fname=fname, fix=fix, config=config
-                    )
-                )
+            linted_path.add(
+                self.lint_string(in_str, fname=fname, fix=fix, config=config)
+            )
         return linted_path
 
+    @staticmethod
+    def _read_file(fname):
+        """Read a file to lint or parse."""
+        # Handle unicode issues gracefully
+        with open(
+            fname, "r", encoding="utf8", errors="backslashreplace"
+        ) as target_file:
+            return target_file.read()
+
+    def _read_files(self, fnames):
+        """Read files in background threads, ahead of linting or parsing them.
+
+        This overlaps the file IO with the work on the previous files.
+
+        Yields:
+            `tuple` of (`fname`, `contents`), in the order of `fnames`.
+
+        """
+        fnames = iter(fnames)
+        with ThreadPoolExecutor(max_workers=self.read_ahead) as executor:
+            pending = deque(
+                (fname, executor.submit(self._read_file, fname))
+                for fname in itertools.islice(fnames, self.read_ahead)
+            )
+            while pending:
+                fname, future = pending.popleft()
+                # Keep the queue topped up before we hand back this file.
+                next_fname = next(fnames, None)
+                if next_fname is not None:
+                    pending.append(
+                        (next_fname, executor.submit(self._read_file, next_fname))
+                    )
+                yield fname, future.result()
+
     def lint_paths(
-        self, paths, fix=False, ignore_non_existent_files=False, ignore_files=True
+        self,
+        paths,
+        fix=False,
+        ignore_non_existent_files=False,
+        ignore_files=True,
+        parallel=1,
     ):
-        """Lint an iterable of paths."""
+        """Lint an iterable of paths.
+
+        Args:
+            paths (iterable of :obj:`str`): The paths to lint.
+            fix (:obj:`bool`, optional): Whether to also fix the files.
+            ignore_non_existent_files (:obj:`bool`, optional): Whether to
+                skip paths which don't exist rather than raising an error.
+            ignore_files (:obj:`bool`, optional): Whether to respect any
+                .sqlfluffignore files.
+            parallel (:obj:`int`, optional): The number of processes to
+                lint files in. Defaults to 1, which lints the files one at
+                a time in this process.
+
+        """
         # If no paths specified - assume local
         if len(paths) == 0:
             paths = (os.getcwd(),)
+        if parallel > 1:
+            return self._lint_paths_parallel(
+                paths,
+                fix=fix,
+                ignore_non_existent_files=ignore_non_existent_files,
+                ignore_files=ignore_files,
+                parallel=parallel,
+            )
         # Set up the result to hold what we get back
         result = LintingResult()
         for path in paths:
@@ -1066,24 +1218,81 @@ class Linter:
             )
         return result
 
+    def _lint_paths_parallel(
+        self, paths, fix, ignore_non_existent_files, ignore_files, parallel
+    ):
+        """Lint an iterable of paths, sharing the files out between processes.
+
+        The results are the same as linting the files one at a time, and the
+        formatter output is still in the same order. The worker processes
+        don't have a formatter, so the only output is once each file is done.
+        """
+        # Work out all the files first, so they can all be shared out.
+        path_files = []
+        jobs = []
+        for path in paths:
+            fnames = self.paths_from_path(
+                path,
+                ignore_non_existent_files=ignore_non_existent_files,
+                ignore_files=ignore_files,
+            )
+            path_files.append((path, len(fnames)))
+            jobs.extend(
+                (fname, self.config.make_child_from_path(fname), fix)
+                for fname in fnames
+            )
+
+        result = LintingResult()
+        with ProcessPoolExecutor(
+            max_workers=parallel,
+            initializer=_init_lint_worker,
+            initargs=(self.sql_exts, self.config, self.user_rules),
+        ) as executor:
+            # NB: map returns the results in the order of the jobs.
+            linted_files = executor.map(_lint_worker, jobs)
+            for path, num_files in path_files:
+                linted_path = LintedPath(path)
+                if self.formatter:
+                    self.formatter.dispatch_path(path)
+                for _ in range(num_files):
+                    linted_file = next(linted_files)
+                    self._dispatch_linted_file(linted_file, fix=fix)
+                    linted_path.add(linted_file)
+                result.add(linted_path)
+        return result
+
     def parse_path(self, path, recurse=True):
         """Parse a path of sql files.
 
         NB: This a generator which will yield the result of each file
         within the path iteratively.
         """
-        for fname in self.paths_from_path(path):
+        for fname, in_str in self._read_files(self.paths_from_path(path)):
             if self.formatter:
                 self.formatter.dispatch_path(path)
             config = self.config.make_child_from_path(fname)
-            # Handle unicode issues gracefully
-            with open(
-                fname, "r", encoding="utf8", errors="backslashreplace"
-            ) as target_file:
-                yield (
-                    *self.parse_string(
-                        target_file.read(), fname=fname, recurse=recurse, config=config
-                    ),
-                    # Also yield the config
-                    config,
-                )
+            yield (
+                *self.parse_string(in_str, fname=fname, recurse=recurse, config=config),
+                # Also yield the config
+                config,
+            )
+
+
+def _init_lint_worker(sql_exts, config, user_rules):
+    """Set up the linter for a worker process.
+
+    See `Linter.lint_paths`.
+    """
+    global _worker_linter
+    _worker_linter = Linter(sql_exts=sql_exts, config=config, user_rules=user_rules)
+
+
+def _lint_worker(job):
+    """Lint a file in a worker process.
+
+    See `Linter.lint_paths`.
+    """
+    fname, config, fix = job
+    return _worker_linter.lint_string(
+        _worker_linter._read_file(fname), fname=fname, fix=fix, config=config
+    )
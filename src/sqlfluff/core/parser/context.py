@@ -10,6 +10,7 @@ and match depth of the current operation.
 
 import logging
 import uuid
+from collections import defaultdict
 
 # Get the parser logger
 parser_logger = logging.getLogger("sqlfluff.parser")
@@ -34,8 +35,9 @@ class RootParseContext:
         # the intended indentation of certain fearures. Specifically it is
         # used in segments_common.Indent.when().
         self.indentation_config = indentation_config or {}
-        # Initialise the blacklist
+        # Initialise the blacklist and the match cache
         self.blacklist = ParseBlacklist()
+        self.match_cache = ParseMatchCache()
         # This is the logger that child objects will latch onto.
         self.logger = parser_logger
         # A uuid for this parse context to enable cache invalidation
@@ -94,10 +96,10 @@ class ParseContext:
     The manipulation of the stack config is done using a context
     manager and layered config objects inside the context.
 
-    When fetching elements from the context, we first look
-    at the top level stack config object and the persistent
-    config values (stored as attributes of the ParseContext
-    itself).
+    When fetching elements from the context, the stack config
+    values are stored as attributes of the ParseContext itself
+    and the persistent config values are read from the root
+    context.
     """
 
     # We create a destroy many ParseContexts so we limit the slots
@@ -113,22 +115,50 @@ class ParseContext:
         self.match_depth = 0
         self.parse_depth = 0
 
-    def __getattr__(self, name):
-        """If the attribute doesn't exist on this, revert to the root."""
-        try:
-            return getattr(self._root_ctx, name)
-        except AttributeError:
-            raise AttributeError(
-                "Attribute {0!r} not found in {1!r} or {2!r}".format(
-                    name, type(self).__name__, type(self._root_ctx).__name__
-                )
-            )
+    # The persistent config is read from the root context. These are
+    # explicit properties rather than a __getattr__ fallback because
+    # they're read often during parsing.
+
+    @property
+    def dialect(self):
+        """The dialect in use, from the root context."""
+        return self._root_ctx.dialect
+
+    @property
+    def indentation_config(self):
+        """The indentation config, from the root context."""
+        return self._root_ctx.indentation_config
+
+    @property
+    def blacklist(self):
+        """The match blacklist, from the root context."""
+        return self._root_ctx.blacklist
+
+    @property
+    def match_cache(self):
+        """The cache of successful matches, from the root context."""
+        return self._root_ctx.match_cache
+
+    @property
+    def logger(self):
+        """The parser logger, from the root context."""
+        return self._root_ctx.logger
+
+    @property
+    def uuid(self):
+        """The uuid of the root context."""
+        return self._root_ctx.uuid
 
     def _copy(self):
         """Mimic the copy.copy() method but restrict only to local vars."""
-        ctx = self.__class__(root_ctx=self._root_ctx)
-        for key in self.__slots__:
-            setattr(ctx, key, getattr(self, key))
+        # This is called for every layer of the parse, so skip __init__
+        # and assign the slots directly rather than looping over them.
+        ctx = object.__new__(self.__class__)
+        ctx._root_ctx = self._root_ctx
+        ctx.recurse = self.recurse
+        ctx.match_segment = self.match_segment
+        ctx.match_depth = self.match_depth
+        ctx.parse_depth = self.parse_depth
         return ctx
 
     def __enter__(self):
@@ -173,16 +203,16 @@ class ParseContext:
 
 
 class ParseBlacklist:
-    """Acts as a cache to stop unnecessary matching."""
+    """Acts as a cache to stop unnecessary matching.
 
-    def __init__(self):
-        self._blacklist_struct = {}
+    The segments are stored alongside each seg_tuple, for the same
+    reason as in the ParseMatchCache: the seg_tuple is made of ids, and
+    a segment which was freed could otherwise have its id reused by a
+    new one, giving a false hit.
+    """
 
-    def _hashed_version(self):
-        return {
-            k: {hash(e) for e in self._blacklist_struct[k]}
-            for k in self._blacklist_struct
-        }
+    def __init__(self):
+        self._blacklist_struct = defaultdict(dict)
 
     def check(self, seg_name, seg_tuple):
         """Check this seg_tuple against this seg_name.
@@ -190,18 +220,44 @@ class ParseBlacklist:
         Has this seg_tuple already been matched
         unsuccessfully against this segment name.
         """
-        if seg_name in self._blacklist_struct:
-            if seg_tuple in self._blacklist_struct[seg_name]:
-                return True
-        return False
+        # NB: Use get() so we don't add empty dicts for every name checked.
+        blacklisted = self._blacklist_struct.get(seg_name)
+        return blacklisted is not None and seg_tuple in blacklisted
 
-    def mark(self, seg_name, seg_tuple):
+    def mark(self, seg_name, seg_tuple, segments):
         """Mark this seg_tuple as not a match with this seg_name."""
-        if seg_name in self._blacklist_struct:
-            self._blacklist_struct[seg_name].add(seg_tuple)
-        else:
-            self._blacklist_struct[seg_name] = {seg_tuple}
+        self._blacklist_struct[seg_name][seg_tuple] = segments
 
     def clear(self):
         """Clear the blacklist struct."""
-        self._blacklist_struct = {}
+        self._blacklist_struct.clear()
+
+
+class ParseMatchCache:
+    """The counterpart of the blacklist, for successful matches.
+
+    Within a match cycle the same reference is often matched against
+    the same segments several times, as different branches of the
+    grammar backtrack over them. Storing the result means each of
+    those is only actually matched once.
+
+    The segments themselves are stored alongside the result, so that
+    the ids in the seg_tuple can't be reused by new objects while
+    they're still in the cache.
+    """
+
+    def __init__(self):
+        self._match_struct = {}
+
+    def get(self, seg_name, seg_tuple):
+        """Get any previous successful match of this seg_tuple."""
+        cached = self._match_struct.get((seg_name, seg_tuple))
+        return cached[1] if cached else None
+
+    def set(self, seg_name, seg_tuple, segments, match):
+        """Store a successful match of these segments against seg_name."""
+        self._match_struct[(seg_name, seg_tuple)] = (segments, match)
+
+    def clear(self):
+        """Clear the match struct."""
+        self._match_struct.clear()
@@ -1,6 +1,6 @@
 """AnyNumberOf and OneOf."""
 
-from typing import List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from ..helpers import trim_non_code_segments
 from ..match_result import MatchResult
@@ -44,59 +44,55 @@ class AnyNumberOf(BaseGrammar):
         """
         return self.optional or self.min_times == 0
 
-    def _prune_options(
-        self, segments: Tuple[BaseSegment, ...], parse_context: ParseContext
-    ) -> Tuple[List[MatchableType], List[str]]:
-        """Use the simple matchers to prune which options to match on."""
-        str_buff = [segment.raw_upper for segment in self._iter_raw_segs(segments)]
-
-        available_options = []
-        simple_opts = []
-        prune_buff = []
-        non_simple = 0
-        pruned_simple = 0
-        matched_simple = 0
-
-        # Find the first code element to match against.
-        first_elem = None
-        for elem in str_buff:
-            if elem.strip():
-                first_elem = elem
-                break
+    @cached_method_for_parse_context
+    def _simple_options(
+        self, parse_context: ParseContext
+    ) -> Tuple[List[Tuple[MatchableType, Optional[FrozenSet[str]]]], Dict]:
+        """Get the simple matchers of each option, for pruning.
 
+        Returns:
+            `tuple` of a list of each option alongside the set of first
+            elements it can match (or None if it isn't simple), and an
+            empty dict, in which to cache the options which are available
+            for each first element as we come across them.
+
+        """
+        options = []
         for opt in self._elements:
             simple = opt.simple(parse_context=parse_context)
-            if simple is None:
-                # This element is not simple, we have to do a
-                # full match with it...
-                available_options.append(opt)
-                non_simple += 1
-                continue
-            # Otherwise we have a simple option, so let's use
-            # it for pruning.
-            for simple_opt in simple:
+            if simple is not None:
                 # Check it's not a whitespace option
-                if not simple_opt.strip():
+                if not all(simple_opt.strip() for simple_opt in simple):
                     raise NotImplementedError(
                         "_prune_options not supported for whitespace matching."
                     )
-                # We want to know if the first meaningful element of the str_buff
-                # matches the option.
-                if simple_opt in str_buff:
-                    # match the FIRST non-whitespace element of the list.
-                    if first_elem != simple_opt:
-                        # No match, carry on.
-                        continue
-                    # If we get here, it's matched the FIRST element of the string buffer.
-                    available_options.append(opt)
-                    simple_opts.append(simple_opt)
-                    matched_simple += 1
-                    break
-            else:
-                # Ditch this option, the simple match has failed
-                prune_buff.append(opt)
-                pruned_simple += 1
-                continue
+                simple = frozenset(simple)
+            options.append((opt, simple))
+        return options, {}
+
+    def _prune_options(
+        self, segments: Tuple[BaseSegment, ...], parse_context: ParseContext
+    ) -> List[MatchableType]:
+        """Use the simple matchers to prune which options to match on.
+
+        NB: The list returned is shared between calls, so don't mutate it.
+        """
+        options, dispatch = self._simple_options(parse_context=parse_context)
+
+        # Find the first code element to match against. Simple options can
+        # only match on this, so there's no need to look any further.
+        first_elem = None
+        for segment in self._iter_raw_segs(segments):
+            if segment.raw_upper.strip():
+                first_elem = segment.raw_upper
+                break
+
+        available_options = dispatch.get(first_elem)
+        if available_options is None:
+            available_options = [
+                opt for opt, simple in options if simple is None or first_elem in simple
+            ]
+            dispatch[first_elem] = available_options
 
         parse_match_logging(
             self.__class__.__name__,
@@ -104,14 +100,11 @@ class AnyNumberOf(BaseGrammar):
             "PRN",
             parse_context=parse_context,
             v_level=3,
-            ns=non_simple,
-            ps=pruned_simple,
-            ms=matched_simple,
-            pruned=prune_buff,
+            ps=len(self._elements) - len(available_options),
             opts=available_options or "ALL",
         )
 
-        return available_options, simple_opts
+        return available_options
 
     def _match_once(
         self, segments: Tuple[BaseSegment, ...], parse_context: ParseContext
@@ -126,9 +119,7 @@ class AnyNumberOf(BaseGrammar):
         # to return earlier if we can.
         # `segments` may already be nested so we need to break out
         # the raw segments within it.
-        available_options, _ = self._prune_options(
-            segments, parse_context=parse_context
-        )
+        available_options = self._prune_options(segments, parse_context=parse_context)
 
         # If we've pruned all the options, return unmatched (with some logging).
         if not available_options:
@@ -216,4 +207,17 @@ class OneOf(AnyNumberOf):
     """
 
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, max_times=1, min_times=1, **kwargs)
+        # OneOf(OneOf(a, b), c) picks the same option as OneOf(a, b, c), so
+        # inline any plain nested OneOf to save a level of matching.
+        elements = []
+        for elem in args:
+            if (
+                type(elem) is OneOf
+                and not elem.optional
+                and not elem.exclude
+                and not elem.ephemeral_segment
+            ):
+                elements.extend(elem._elements)
+            else:
+                elements.append(elem)
+        super().__init__(*elements, max_times=1, min_times=1, **kwargs)
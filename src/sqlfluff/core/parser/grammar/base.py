@@ -304,9 +304,10 @@ class BaseGrammar(Matchable):
                     except ValueError:
                         pass
 
-            # Sort the match queue. First to process AT THE END.
-            # That means we pop from the end.
-            match_queue = sorted(match_queue, key=lambda x: x[1])
+            # Sort the match queue so the earliest position comes first. The
+            # sort is stable, so for options found at the same position the
+            # order of the matchers is kept.
+            match_queue.sort(key=lambda x: x[1])
 
             parse_match_logging(
                 cls.__name__,
@@ -318,10 +319,9 @@ class BaseGrammar(Matchable):
                 sb=str_buff,
             )
 
-            while match_queue:
+            for queued_matcher, queued_buff_pos, queued_option in match_queue:
                 # We've managed to match. We can shortcut home.
                 # NB: We may still need to deal with whitespace.
-                queued_matcher, queued_buff_pos, queued_option = match_queue.pop()
                 # Here we do the actual transform to the new segment.
                 match = queued_matcher.match(segments[queued_buff_pos:], parse_context)
                 if not match:
@@ -337,7 +337,9 @@ class BaseGrammar(Matchable):
                     )
                     continue
                 # Ok we have a match. Because we sorted the list, we'll take it!
+                # Nothing later in the queue can be earlier, so stop here.
                 best_simple_match = (segments[:queued_buff_pos], match, queued_matcher)
+                break
 
         if not non_simple_matchers:
             # There are no other matchers, we can just shortcut now.
@@ -616,7 +618,7 @@ class Ref(BaseGrammar):
         on the underlying class.
 
         The match element of Ref, also implements the caching
-        using the parse_context `blacklist` methods.
+        using the parse_context `blacklist` and `match_cache` methods.
         """
         elem = self._get_elem(dialect=parse_context.dialect)
 
@@ -629,8 +631,9 @@ class Ref(BaseGrammar):
         # We used to use seg_to_tuple here, but it was too slow,
         # so instead we rely on segments not being mutated within a given
         # match cycle and so the ids should continue to refer to unchanged
-        # objects.
-        seg_tuple = (id(seg) for seg in segments)
+        # objects. NB: This must be a tuple rather than a generator, which
+        # would only ever hash by its own identity.
+        seg_tuple = tuple(id(seg) for seg in segments)
         self_name = self._get_ref()
         if parse_context.blacklist.check(self_name, seg_tuple):
             # This has been tried before.
@@ -643,13 +646,19 @@ class Ref(BaseGrammar):
                 self_name=self_name,
             )
             return MatchResult.from_unmatched(segments)
+        cached = parse_context.match_cache.get(self_name, seg_tuple)
+        if cached:
+            # This has been matched before, don't do it again.
+            return cached
 
         # Match against that. NB We're not incrementing the match_depth here.
         # References shouldn't relly count as a depth of match.
         with parse_context.matching_segment(self._get_ref()) as ctx:
             resp = elem.match(segments=segments, parse_context=ctx)
-        if not resp:
-            parse_context.blacklist.mark(self_name, seg_tuple)
+        if resp:
+            parse_context.match_cache.set(self_name, seg_tuple, segments, resp)
+        else:
+            parse_context.blacklist.mark(self_name, seg_tuple, segments)
         return resp
 
     @classmethod
@@ -55,6 +55,15 @@ class Delimited(OneOf):
         # delimiters is a list of tuples containing delimiter segments as we find them.
         delimiters: List[BaseSegment] = []
 
+        # We look ahead for the same things on every pass of the loop below,
+        # so only work out what they are once.
+        matchers = [self.delimiter]
+        if self.terminator:
+            matchers.append(self.terminator)
+        # If gaps aren't allowed, a gap (or non-code segment), acts like a terminator.
+        if not self.allow_gaps:
+            matchers.append(NonCodeMatcher())
+
         # First iterate through all the segments, looking for the delimiter.
         # Second, split the list on each of the delimiters, and ensure that
         # each sublist in turn matches one of the elements.
@@ -81,13 +90,6 @@ class Delimited(OneOf):
 
             # We rely on _bracket_sensitive_look_ahead_match to do the bracket counting
             # element of this now. We look ahead to find a delimiter or terminator.
-            matchers = [self.delimiter]
-            if self.terminator:
-                matchers.append(self.terminator)
-            # If gaps aren't allowed, a gap (or non-code segment), acts like a terminator.
-            if not self.allow_gaps:
-                matchers.append(NonCodeMatcher())
-
             with parse_context.deeper_match() as ctx:
                 (
                     pre_content,
@@ -16,6 +16,39 @@ from .base import BaseGrammar, Ref, cached_method_for_parse_context
 class Sequence(BaseGrammar):
     """Match a specific sequence of elements."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(
+            *self._flatten_elements(args, kwargs.get("allow_gaps", True)), **kwargs
+        )
+
+    @staticmethod
+    def _flatten_elements(args, allow_gaps):
+        """Inline the elements of any plain nested sequences.
+
+        `Sequence(Sequence(a, b), c)` matches exactly like `Sequence(a, b, c)`
+        but costs an extra level of matching for every attempt. We only
+        inline an inner sequence if that's true: it's not optional or
+        ephemeral, treats gaps the same way, contains no meta segments
+        (which would otherwise be positioned differently around whitespace)
+        and has at least one required element. A sequence of only optional
+        elements still has to match *something* when it's nested, but its
+        elements could all be skipped once inlined.
+        """
+        elements = []
+        for elem in args:
+            if (
+                type(elem) is Sequence
+                and not elem.optional
+                and not elem.ephemeral_segment
+                and elem.allow_gaps == allow_gaps
+                and not any(e.is_meta for e in elem._elements)
+                and not all(e.is_optional() for e in elem._elements)
+            ):
+                elements.extend(elem._elements)
+            else:
+                elements.append(elem)
+        return elements
+
     @cached_method_for_parse_context
     def simple(self, parse_context: ParseContext) -> Optional[List[str]]:
         """Does this matcher support a uppercase hash matching route?
@@ -42,7 +75,9 @@ class Sequence(BaseGrammar):
         if isinstance(segments, BaseSegment):
             segments = tuple(segments)
 
-        matched_segments = MatchResult.from_empty()
+        # Accumulate matched segments in a list and make a tuple once at the
+        # end, rather than concatenating a new tuple for every element.
+        matched_segments = []
         unmatched_segments = segments
 
         for idx, elem in enumerate(self._elements):
@@ -56,25 +91,15 @@ class Sequence(BaseGrammar):
                     # the meta segment.
                     if matched_segments:
                         # Get from end of last
-                        last_matched = matched_segments.matched_segments[-1]
+                        last_matched = matched_segments[-1]
                         meta_pos_marker = last_matched.get_end_pos_marker()
                     else:
                         # Get from start of next
                         meta_pos_marker = unmatched_segments[0].pos_marker
-                    matched_segments += elem(pos_marker=meta_pos_marker)
+                    matched_segments.append(elem(pos_marker=meta_pos_marker))
                     break
 
-                # Consume non-code if appropriate
-                if self.allow_gaps:
-                    pre_nc, mid_seg, post_nc = trim_non_code_segments(
-                        unmatched_segments
-                    )
-                else:
-                    pre_nc = ()
-                    mid_seg = unmatched_segments
-                    post_nc = ()
-
-                if len(pre_nc + mid_seg + post_nc) == 0:
+                if not unmatched_segments:
                     # We've run our of sequence without matching everyting.
                     # Do only optional or meta elements remain?
                     if all(e.is_optional() or e.is_meta for e in self._elements[idx:]):
@@ -83,35 +108,39 @@ class Sequence(BaseGrammar):
                         # unless it's a meta segment.
 
                         # Get hold of the last thing to be matched, so we've got an anchor.
-                        last_matched = matched_segments.matched_segments[-1]
+                        last_matched = matched_segments[-1]
                         meta_pos_marker = last_matched.get_end_pos_marker()
                         # NB: This complicated expression just adds indents as appropriate.
-                        return matched_segments + tuple(
+                        matched_segments.extend(
                             e(pos_marker=meta_pos_marker)
                             for e in self._elements[idx:]
                             if e.is_meta and e.is_enabled(parse_context=parse_context)
                         )
+                        return self._complete_match(segments, matched_segments, ())
                     else:
                         # we've got to the end of the sequence without matching all
                         # required elements.
                         return MatchResult.from_unmatched(segments)
                 else:
-                    # We've already dealt with potential whitespace above, so carry on to matching
+                    # Consume non-code if appropriate
+                    if self.allow_gaps:
+                        pre_nc, mid_seg, post_nc = trim_non_code_segments(
+                            unmatched_segments
+                        )
+                    else:
+                        pre_nc = ()
+                        mid_seg = unmatched_segments
+                        post_nc = ()
+
                     with parse_context.deeper_match() as ctx:
                         elem_match = elem.match(mid_seg, parse_context=ctx)
 
                     if elem_match.has_match():
                         # We're expecting mostly partial matches here, but complete
                         # matches are possible. Don't be greedy with whitespace!
-                        matched_segments += pre_nc + elem_match.matched_segments
+                        matched_segments.extend(pre_nc)
+                        matched_segments.extend(elem_match.matched_segments)
                         unmatched_segments = elem_match.unmatched_segments + post_nc
-                        # Each time we do this, we do a sense check to make sure we haven't
-                        # dropped anything. (Because it's happened before!).
-                        check_still_complete(
-                            segments,
-                            matched_segments.matched_segments,
-                            unmatched_segments,
-                        )
 
                         # Break out of the while loop and move to the next element.
                         break
@@ -130,7 +159,20 @@ class Sequence(BaseGrammar):
         # but still have some segments left (or perhaps have precisely zero left).
         # In either case, we're golden. Return successfully, with any leftovers as
         # the unmatched elements.
-        return MatchResult(matched_segments.matched_segments, unmatched_segments)
+        return self._complete_match(segments, matched_segments, unmatched_segments)
+
+    @staticmethod
+    def _complete_match(segments, matched_segments, unmatched_segments):
+        """Make the MatchResult for a successful match of the sequence.
+
+        We do a sense check here to make sure we haven't dropped anything.
+        (Because it's happened before!). This used to be done after every
+        element, but that joins up the raw of every segment each time,
+        so it's only done once for the whole sequence.
+        """
+        matched_segments = tuple(matched_segments)
+        check_still_complete(segments, matched_segments, unmatched_segments)
+        return MatchResult(matched_segments, unmatched_segments)
 
 
 class Bracketed(Sequence):
@@ -1,7 +1,6 @@
 """The code for the Lexer."""
 
-from typing import Optional, List, Tuple
-from collections import namedtuple
+from typing import Dict, Optional, List, Tuple
 import re
 
 from .markers import FilePositionMarker
@@ -10,13 +9,41 @@ from ..errors import SQLLexError
 from ..config import FluffConfig
 
 
-class LexMatch(namedtuple("LexMatch", ["new_string", "new_pos", "segments"])):
-    """A class to hold matches from the Lexer."""
+class LexMatch:
+    """A class to hold matches from the Lexer.
+
+    This uses `__slots__` rather than being a `namedtuple` to keep
+    instances small and attribute access fast.
+    """
+
+    __slots__ = "new_string", "new_pos", "segments"
+
+    def __init__(self, new_string, new_pos, segments):
+        self.new_string = new_string
+        self.new_pos = new_pos
+        self.segments = segments
 
     def __bool__(self):
         """A LexMatch is truthy if it contains a non-zero number of matched segments."""
         return len(self.segments) > 0
 
+    def __eq__(self, other):
+        return (
+            isinstance(other, LexMatch)
+            and self.new_string == other.new_string
+            and self.new_pos == other.new_pos
+            and self.segments == other.segments
+        )
+
+    def __hash__(self):
+        # Hashable like the namedtuple this used to be.
+        return hash((self.new_string, self.new_pos, self.segments))
+
+    def __repr__(self):
+        return "<LexMatch: new_string={0!r}, new_pos={1}, segments={2!r}>".format(
+            self.new_string, self.new_pos, self.segments
+        )
+
 
 class SingletonMatcher:
     """This singleton matcher matches single characters.
@@ -42,11 +69,46 @@ class SingletonMatcher:
         self.target_seg_class = target_seg_class
         self.subdivide = subdivide
         self.trim_post_subdivide = trim_post_subdivide
+        # Make the segment classes and compile the regexes for any subdivision
+        # or trimming up front. These are the same for every match, so there's
+        # no need to generate them fresh each time.
+        self._divider_class = self._make_seg_class(subdivide)
+        self._divider_regex = self._compile_spec(subdivide)
+        self._trim_class = self._make_seg_class(trim_post_subdivide)
+        self._trim_regex = self._compile_spec(trim_post_subdivide)
+        # An anchored version to find any trimmable section at the end.
+        self._trim_tail_regex = self._compile_spec(trim_post_subdivide, r"\Z")
+
+    @staticmethod
+    def _make_seg_class(spec):
+        """Make a segment class from a subdivide or trim spec (if there is one)."""
+        if not spec:
+            return None
+        return RawSegment.make(spec["regex"], name=spec["name"], type=spec["type"])
+
+    @staticmethod
+    def _compile_spec(spec, suffix=""):
+        """Compile the regex of a subdivide or trim spec (if there is one)."""
+        if not spec:
+            return None
+        return re.compile("(?:{0}){1}".format(spec["regex"], suffix), re.DOTALL)
+
+    def _regex_source(self):
+        """The source of a regex equivalent to this matcher."""
+        return re.escape(self.template)
 
-    def _match(self, forward_string):
-        """The private match function. Just look for a single character match."""
-        if forward_string[0] == self.template:
-            return forward_string[0]
+    def _match(self, forward_string, pos=0):
+        """The private match function. Just look for a single character match.
+
+        Args:
+            forward_string (:obj:`str`): The string to match against.
+            pos (:obj:`int`, optional): The offset within `forward_string`
+                at which to look for a match. This allows callers to scan
+                along a string without slicing it.
+
+        """
+        if forward_string[pos] == self.template:
+            return self.template
         else:
             return None
 
@@ -58,43 +120,33 @@ class SingletonMatcher:
 
         """
         seg_buff = ()
-        cont_buff = matched
         cont_pos_buff = start_pos
         idx = 0
 
         if self.trim_post_subdivide:
-            trimmer = re.compile(self.trim_post_subdivide["regex"], re.DOTALL)
-            TrimClass = RawSegment.make(
-                self.trim_post_subdivide["regex"],
-                name=self.trim_post_subdivide["name"],
-                type=self.trim_post_subdivide["type"],
-            )
-
-            for trim_mat in trimmer.finditer(matched):
-                trim_span = trim_mat.span()
-                # Is it at the start?
-                if trim_span[0] == 0:
-                    seg_buff += (
-                        TrimClass(
-                            raw=matched[: trim_span[1]], pos_marker=cont_pos_buff
-                        ),
-                    )
-                    idx = trim_span[1]
-                    cont_pos_buff = cont_pos_buff.advance_by(matched[: trim_span[1]])
-                    # Have we consumed the whole string? This avoids us having
-                    # an empty string on the end.
-                    if idx == len(matched):
-                        break
-                # Is it at the end?
-                if trim_span[1] == len(matched):
+            TrimClass = self._trim_class
+            # We only trim at the start and the end, so rather than
+            # iterating through every match in the string, we look
+            # for matches at each end directly.
+            lead_mat = self._trim_regex.match(matched)
+            if lead_mat:
+                idx = lead_mat.end()
+                seg_buff += (TrimClass(raw=matched[:idx], pos_marker=cont_pos_buff),)
+                cont_pos_buff = cont_pos_buff.advance_by(matched[:idx])
+            # Have we consumed the whole string? This avoids us having
+            # an empty string on the end.
+            if idx < len(matched):
+                tail_mat = self._trim_tail_regex.search(matched, idx)
+                if tail_mat:
+                    tail_start = tail_mat.start()
                     seg_buff += (
                         self.target_seg_class(
-                            raw=matched[idx : trim_span[0]], pos_marker=cont_pos_buff
+                            raw=matched[idx:tail_start], pos_marker=cont_pos_buff
                         ),
                         TrimClass(
-                            raw=matched[trim_span[0] : trim_span[1]],
+                            raw=matched[tail_start:],
                             pos_marker=cont_pos_buff.advance_by(
-                                cont_buff[idx : trim_span[0]]
+                                matched[idx:tail_start]
                             ),
                         ),
                     )
@@ -118,37 +170,34 @@ class SingletonMatcher:
         # Can we have to subdivide?
         if self.subdivide:
             # Yes subdivision
-            seg_buff = ()
-            str_buff = matched
+            seg_buff = []
             pos_buff = start_pos
-            divider = re.compile(self.subdivide["regex"], re.DOTALL)
-            DividerClass = RawSegment.make(
-                self.subdivide["regex"],
-                name=self.subdivide["name"],
-                type=self.subdivide["type"],
-            )
+            # We keep an offset into the string, rather than slicing
+            # off the remainder each time we find a division.
+            idx = 0
+            divider = self._divider_regex
+            DividerClass = self._divider_class
 
             while True:
                 # Iterate through subdividing as appropriate
-                mat = divider.search(str_buff)
+                mat = divider.search(matched, idx)
                 if mat:
                     # Found a division
-                    span = mat.span()
-                    trimmed_segments = self._trim(str_buff[: span[0]], pos_buff)
-                    div_seg = DividerClass(
-                        raw=str_buff[span[0] : span[1]],
-                        pos_marker=pos_buff.advance_by(str_buff[: span[0]]),
+                    div_start, div_end = mat.span()
+                    seg_buff.extend(self._trim(matched[idx:div_start], pos_buff))
+                    pos_buff = pos_buff.advance_by(matched[idx:div_start])
+                    seg_buff.append(
+                        DividerClass(
+                            raw=matched[div_start:div_end], pos_marker=pos_buff
+                        )
                     )
-                    seg_buff += trimmed_segments + (div_seg,)
-                    pos_buff = pos_buff.advance_by(str_buff[: span[1]])
-                    str_buff = str_buff[span[1] :]
+                    pos_buff = pos_buff.advance_by(matched[div_start:div_end])
+                    idx = div_end
                 else:
                     # No more division matches. Trim?
-                    trimmed_segments = self._trim(str_buff, pos_buff)
-                    seg_buff += trimmed_segments
-                    pos_buff = pos_buff.advance_by(str_buff)
+                    seg_buff.extend(self._trim(matched[idx:], pos_buff))
                     break
-            return seg_buff
+            return tuple(seg_buff)
         else:
             # NB: Tuple literal
             return (self.target_seg_class(raw=matched, pos_marker=start_pos),)
@@ -209,9 +258,13 @@ class RegexMatcher(SingletonMatcher):
         flags = re.DOTALL
         self._compiled_regex = re.compile(self.template, flags)
 
-    def _match(self, forward_string):
+    def _regex_source(self):
+        """The source of a regex equivalent to this matcher."""
+        return self.template
+
+    def _match(self, forward_string, pos=0):
         """Use regexes to match chunks."""
-        match = self._compiled_regex.match(forward_string)
+        match = self._compiled_regex.match(forward_string, pos)
         if match:
             return match.group(0)
         else:
@@ -230,28 +283,132 @@ class RepeatedMultiMatcher(SingletonMatcher):
 
     def __init__(self, *submatchers):
         self.submatchers = submatchers
+        # A lookup of first character to the submatchers which could
+        # possibly match a string starting with it, populated lazily.
+        self._candidates_by_char = {}
+        self._combined_regex, self._group_lookup = self._compile_combined(submatchers)
+
+    @staticmethod
+    def _compile_combined(submatchers):
+        """Combine the submatchers into a single alternation regex.
+
+        Each submatcher becomes a named group, in priority order, so that
+        one pass of the regex engine finds the same match as trying each
+        submatcher in turn. The matcher responsible for a match is then
+        found from `lastgroup` (the outermost group always closes last).
+
+        Returns:
+            :obj:`tuple` of the compiled regex (or None if the submatchers
+            cannot be combined) and a :obj:`dict` of group name to matcher.
+
+        """
+        group_lookup = {}
+        alternatives = []
+        for idx, matcher in enumerate(submatchers):
+            if not hasattr(matcher, "_regex_source"):
+                return None, {}
+            group_name = "m{0}".format(idx)
+            group_lookup[group_name] = matcher
+            alternatives.append(
+                "(?P<{0}>{1})".format(group_name, matcher._regex_source())
+            )
+        try:
+            combined_regex = re.compile("|".join(alternatives), re.DOTALL)
+        except re.error:
+            # e.g. a template uses global inline flags or clashing group names.
+            return None, {}
+        return combined_regex, group_lookup
+
+    def _candidates(self, char):
+        """Get the submatchers which could match a string starting with `char`.
+
+        Singleton matchers can only match their own character, so we can
+        rule them out up front. We can't say the same for regexes so those
+        are always candidates. Priority order is preserved.
+        """
+        try:
+            return self._candidates_by_char[char]
+        except KeyError:
+            candidates = tuple(
+                matcher
+                for matcher in self.submatchers
+                if type(matcher) is not SingletonMatcher or matcher.template == char
+            )
+            self._candidates_by_char[char] = candidates
+            return candidates
+
+    def _match_sequential(self, forward_string, pos):
+        """Try each candidate submatcher in turn at `pos`.
+
+        Returns:
+            :obj:`tuple` of the matching submatcher and the matched string,
+            or (None, None) if nothing matched.
+
+        """
+        for matcher in self._candidates(forward_string[pos]):
+            matched = matcher._match(forward_string, pos)
+            if matched:
+                return matcher, matched
+        return None, None
 
     def match(self, forward_string, start_pos):
         """Iteratively match strings using the selection of submatchers."""
-        seg_buff = ()
-        while True:
-            if len(forward_string) == 0:
-                return LexMatch(forward_string, start_pos, seg_buff)
-            for matcher in self.submatchers:
-                res = matcher.match(forward_string, start_pos)
-                if res.segments:
-                    # If we have new segments then whoop!
-                    seg_buff += res.segments
-                    forward_string = res.new_string
-                    start_pos = res.new_pos
-                    # Cycle back around again and start with the top
-                    # matcher again.
+        # Accumulate in a list and make a tuple once at the end, rather
+        # than concatenating tuples (which is quadratic in the number
+        # of segments).
+        seg_buff = []
+        idx, end_pos = self.match_from(forward_string, 0, start_pos, seg_buff)
+        return LexMatch(forward_string[idx:], end_pos, tuple(seg_buff))
+
+    def match_from(self, raw, idx, start_pos, seg_buff):
+        """Iteratively match from an offset within a string.
+
+        Rather than slicing the string after every match, we keep a
+        running offset into it. This keeps the scan linear in the
+        length of the string.
+
+        Args:
+            raw (:obj:`str`): The whole string being lexed.
+            idx (:obj:`int`): The offset within `raw` to start from.
+            start_pos (:obj:`FilePositionMarker`): The position of `idx`.
+            seg_buff (:obj:`list`): A list to append new segments to.
+
+        Returns:
+            :obj:`tuple` of the offset and position marker at which we
+            could no longer match (which will be the end of the string if
+            we've matched all of it).
+
+        """
+        str_len = len(raw)
+        combined_regex = self._combined_regex
+        group_lookup = self._group_lookup
+        while idx < str_len:
+            mat = combined_regex.match(raw, idx) if combined_regex else None
+            if mat and mat.end() > idx:
+                matcher = group_lookup[mat.lastgroup]
+                matched = mat.group(0)
+            else:
+                # Either there's no combined regex, or the highest priority
+                # match was empty. Submatchers treat empty matches as no
+                # match at all, so fall back to trying each in turn.
+                matcher, matched = self._match_sequential(raw, idx)
+                if not matched:
+                    # We've got so far, but now can't match. Return
                     break
-                else:
-                    continue
+            # If we have new segments then whoop!
+            if matcher.subdivide:
+                new_segments = matcher._subdivide(matched, start_pos)
+                seg_buff.extend(new_segments)
+                start_pos = new_segments[-1].get_end_pos_marker()
             else:
-                # We've got so far, but now can't match. Return
-                return LexMatch(forward_string, start_pos, seg_buff)
+                # Most matchers don't subdivide, so skip the general
+                # method and make the single segment directly.
+                seg_buff.append(
+                    matcher.target_seg_class(raw=matched, pos_marker=start_pos)
+                )
+                start_pos = start_pos.advance_by(matched)
+            idx += len(matched)
+        return idx, start_pos
 
     @classmethod
     def from_struct(cls, s):
@@ -280,6 +437,12 @@ class RepeatedMultiMatcher(SingletonMatcher):
 class Lexer:
     """The Lexer class actually does the lexing step."""
 
+    # A cache of matchers already built from lexer structs, keyed
+    # on the id of the struct. Dialects are long lived, and we make
+    # a new Lexer for every file, so this saves recompiling the same
+    # matchers (and their regexes) over and over.
+    _matcher_cache: Dict[int, Tuple[list, RepeatedMultiMatcher]] = {}
+
     def __init__(
         self,
         config: Optional[FluffConfig] = None,
@@ -289,11 +452,23 @@ class Lexer:
         # Allow optional config and dialect
         self.config = FluffConfig.from_kwargs(config=config, dialect=dialect)
         lexer_struct = self.config.get("dialect_obj").get_lexer_struct()
-        self.matcher = RepeatedMultiMatcher.from_struct(lexer_struct)
+        self.matcher = self._get_matcher(lexer_struct)
         self.last_resort_lexer = last_resort_lexer or RegexMatcher.from_shorthand(
             "<unlexable>", r"[^\t\n\,\.\ \-\+\*\\\/\'\"\;\:\[\]\(\)\|]*", is_code=True
         )
 
+    @classmethod
+    def _get_matcher(cls, lexer_struct) -> RepeatedMultiMatcher:
+        """Get the matcher for a lexer struct, building it if not cached."""
+        cached = cls._matcher_cache.get(id(lexer_struct))
+        if cached:
+            return cached[1]
+        matcher = RepeatedMultiMatcher.from_struct(lexer_struct)
+        # Keep a reference to the struct itself in the cache so that
+        # its id can't be reused by another object.
+        cls._matcher_cache[id(lexer_struct)] = (lexer_struct, matcher)
+        return matcher
+
     def lex(self, raw: str) -> Tuple[Tuple[RawSegment, ...], List[SQLLexError]]:
         """Take a string and return segments.
 
@@ -302,29 +477,34 @@ class Lexer:
         package it up as unlexable and keep track of the exceptions.
         """
         start_pos = FilePositionMarker.from_fresh()
-        segment_buff = ()
+        segment_buff: List[RawSegment] = []
         violations = []
+        idx = 0
 
+        # We lex the whole string in one pass, keeping track of our offset
+        # within it rather than slicing it each time we hit a problem.
         while True:
-            res = self.matcher.match(raw, start_pos)
-            segment_buff += res.segments
-            if len(res.new_string) > 0:
+            idx, start_pos = self.matcher.match_from(raw, idx, start_pos, segment_buff)
+            if idx < len(raw):
                 violations.append(
                     SQLLexError(
                         "Unable to lex characters: '{0!r}...'".format(
-                            res.new_string[:10]
+                            raw[idx : idx + 10]
                         ),
-                        pos=res.new_pos,
+                        pos=start_pos,
                     )
                 )
-                resort_res = self.last_resort_lexer.match(res.new_string, res.new_pos)
-                if not resort_res:
+                resort_match = self.last_resort_lexer._match(raw, idx)
+                if not resort_match:
                     # If we STILL can't match, then just panic out.
                     raise violations[-1]
 
-                raw = resort_res.new_string
-                start_pos = resort_res.new_pos
-                segment_buff += resort_res.segments
+                resort_segments = self.last_resort_lexer._subdivide(
+                    resort_match, start_pos
+                )
+                segment_buff.extend(resort_segments)
+                start_pos = resort_segments[-1].get_end_pos_marker()
+                idx += len(resort_match)
             else:
                 break
-        return segment_buff, violations
+        return tuple(segment_buff), violations
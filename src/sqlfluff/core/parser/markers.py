@@ -13,6 +13,10 @@ protoFilePositionMarker = namedtuple(
 class FilePositionMarker(protoFilePositionMarker):
     """This class is a construct to keep track of positions within a file."""
 
+    # There's one of these for every raw segment, so like the namedtuple
+    # it's built on, don't give each one a __dict__.
+    __slots__ = ()
+
     def advance_by(self, raw="", idx=0):
         """Construct a new `FilePositionMarker` at a point ahead of this one.
 
@@ -22,18 +26,20 @@ class FilePositionMarker(protoFilePositionMarker):
             idx (:obj:`int`, optional): The statement index to advance by.
 
         """
-        stmt = self.statement_index
         line = self.line_no
         pos = self.line_pos
-        char_pos = self.char_pos
-        for elem in raw:
-            char_pos += 1
-            if elem == "\n":
-                line += 1
-                pos = 1
-            else:
-                pos += 1
-        return FilePositionMarker(stmt + idx, line, pos, char_pos)
+        # Count newlines with str methods rather than iterating through
+        # each character in python.
+        newlines = raw.count("\n")
+        if newlines:
+            line += newlines
+            # The position is measured from the character after the last newline.
+            pos = len(raw) - raw.rfind("\n")
+        else:
+            pos += len(raw)
+        return FilePositionMarker(
+            self.statement_index + idx, line, pos, self.char_pos + len(raw)
+        )
 
     @classmethod
     def from_fresh(cls):
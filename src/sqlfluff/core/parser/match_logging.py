@@ -1,7 +1,22 @@
 """Classes to help with match logging."""
 
+import logging
+
 from .helpers import join_segments_raw_curtailed
 
+# The logging level of each of the verbosity levels we log matching at.
+_v_level_log_levels = {3: logging.INFO, 4: logging.DEBUG}
+
+
+def is_match_logging(logger, v_level):
+    """Will anything be logged at this verbosity level?
+
+    Matching happens a *lot*, so it's worth checking this before
+    even making a log object.
+    """
+    log_level = _v_level_log_levels.get(v_level)
+    return log_level is not None and logger.isEnabledFor(log_level)
+
 
 class LateLoggingObject(object):
     """A basic late binding log object for parse_match_logging.
@@ -73,6 +88,8 @@ class ParseMatchLogObject(LateLoggingObject):
 
 def parse_match_logging(grammar, func, msg, parse_context, v_level=3, **kwargs):
     """Log in a particular consistent format for use while matching."""
+    if not is_match_logging(parse_context.logger, v_level):
+        return
     # Make a late bound log object so we only do the string manipulation when we need to.
     ParseMatchLogObject(
         parse_context, grammar, func, msg, v_level=v_level, **kwargs
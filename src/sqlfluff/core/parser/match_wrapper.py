@@ -1,6 +1,6 @@
 """Defined the `match_wrapper` which adds validation and logging to match methods."""
 
-from .match_logging import ParseMatchLogObject
+from .match_logging import ParseMatchLogObject, is_match_logging
 from .match_result import MatchResult
 from .helpers import join_segments_raw_curtailed
 
@@ -64,14 +64,15 @@ def match_wrapper(v_level=3):
                 )
 
             # Log the result.
-            WrapParseMatchLogObject(
-                grammar=func.__qualname__,
-                func="match",
-                match=m,
-                parse_context=parse_context,
-                segments=segments,
-                v_level=v_level,
-            ).log()
+            if is_match_logging(parse_context.logger, v_level):
+                WrapParseMatchLogObject(
+                    grammar=func.__qualname__,
+                    func="match",
+                    match=m,
+                    parse_context=parse_context,
+                    segments=segments,
+                    v_level=v_level,
+                ).log()
 
             # Basic Validation, skipped here because it still happens in the parse commands.
             return m
@@ -8,6 +8,7 @@ Here we define:
   analysis.
 """
 
+import logging
 from io import StringIO
 from benchit import BenchIt
 from cached_property import cached_property
@@ -44,6 +45,12 @@ class BaseSegment:
     purpose as a matcher.
     """
 
+    # NB: There are no slots here, but declaring them means that the RawSegment
+    # (of which there are many) can use __slots__ and not have a __dict__.
+    # Subclasses which hold other segments don't declare any, so they still get
+    # a __dict__, which the cached properties below rely on.
+    __slots__ = ()
+
     # `type` should be the *category* of this kind of segment
     type = "base"
     parse_grammar: Optional[Matchable] = None
@@ -208,7 +215,8 @@ class BaseSegment:
     @staticmethod
     def expand(segments, parse_context):
         """Expand the list of child segments using their `parse` methods."""
-        segs = ()
+        # Collect into a list, rather than concatenating tuples as we go.
+        segs = []
         for stmt in segments:
             try:
                 if not stmt.is_expandable:
@@ -217,7 +225,7 @@ class BaseSegment:
                         parse_context.parse_depth,
                         stmt,
                     )
-                    segs += (stmt,)
+                    segs.append(stmt)
                     continue
             except Exception as err:
                 # raise ValueError("{0} has no attribute `is_expandable`. This segment appears poorly constructed.".format(stmt))
@@ -232,18 +240,22 @@ class BaseSegment:
                         stmt
                     )
                 )
-            parse_depth_msg = "Parse Depth {0}. Expanding: {1}: {2!r}".format(
-                parse_context.parse_depth,
-                stmt.__class__.__name__,
-                curtail_string(stmt.raw, length=40),
-            )
-            parse_context.logger.info(frame_msg(parse_depth_msg))
+            # NB: Getting the raw of a segment means walking all of it,
+            # so only do it if this will be logged.
+            if parse_context.logger.isEnabledFor(logging.INFO):
+                parse_depth_msg = "Parse Depth {0}. Expanding: {1}: {2!r}".format(
+                    parse_context.parse_depth,
+                    stmt.__class__.__name__,
+                    curtail_string(stmt.raw, length=40),
+                )
+                parse_context.logger.info(frame_msg(parse_depth_msg))
             res = stmt.parse(parse_context=parse_context)
             if isinstance(res, BaseSegment):
-                segs += (res,)
+                segs.append(res)
             else:
                 # We might get back an iterable of segments
-                segs += tuple(res)
+                segs.extend(res)
+        segs = tuple(segs)
         # Basic Validation
         check_still_complete(segments, segs, ())
         return segs
@@ -441,7 +453,9 @@ class BaseSegment:
                 start_pos = elem.get_start_pos_marker()
                 end_pos = elem.get_end_pos_marker()
                 prev_seg = elem
-                if start_pos.advance_by(elem.raw) != end_pos:
+                # The end of a raw segment is worked out from its raw, so it
+                # can't be inconsistent. Only check the ones with children.
+                if not elem.is_raw() and start_pos.advance_by(elem.raw) != end_pos:
                     raise TypeError(
                         "In {0} {1}, found an element of the segments tuple which"
                         " isn't self consistent: {2}".format(text, type(self), elem)
@@ -533,11 +547,13 @@ class BaseSegment:
         return self.structural_simplify(self.to_tuple(**kwargs))
 
     def raw_list(self):
-        """Return a list of raw elements, mostly for testing or searching."""
-        buff = []
-        for s in self.segments:
-            buff += s.raw_list()
-        return buff
+        """Return a list of raw elements, mostly for testing or searching.
+
+        To avoid building intermediate lists at every level of the tree,
+        this is built in one go from `iter_raw_seg`. Use that directly
+        if you only need to iterate.
+        """
+        return [seg.raw for seg in self.iter_raw_seg()]
 
     def iter_raw_seg(self):
         """Iterate raw segments, mostly for searching."""
@@ -628,9 +644,10 @@ class BaseSegment:
         Use the parse setting in the context for testing, mostly to check how deep to go.
         True/False for yes or no, an integer allows a certain number of levels.
         """
-        # Clear the blacklist cache so avoid missteps
+        # Clear the blacklist and match caches so avoid missteps
         if parse_context:
             parse_context.blacklist.clear()
+            parse_context.match_cache.clear()
 
         # the parse_depth and recurse kwargs control how deep we will recurse for testing.
         if not self.segments:
@@ -641,9 +658,8 @@ class BaseSegment:
         if self.parse_grammar is None:
             # No parse grammar, go straight to expansion
             parse_context.logger.debug(
-                "{0}.parse: no grammar. Going straight to expansion".format(
-                    self.__class__.__name__
-                )
+                "%s.parse: no grammar. Going straight to expansion",
+                self.__class__.__name__,
             )
         else:
             # For debugging purposes. Ensure that we don't have non-code elements
@@ -726,15 +742,21 @@ class BaseSegment:
 
         # Recurse if allowed (using the expand method to deal with the expansion)
         parse_context.logger.debug(
-            "{0}.parse: Done Parse. Plotting Recursion. Recurse={1!r}".format(
-                self.__class__.__name__, parse_context.recurse
-            )
-        )
-        parse_depth_msg = "###\n#\n# Beginning Parse Depth {0}: {1}\n#\n###\nInitial Structure:\n{2}".format(
-            parse_context.parse_depth + 1, self.__class__.__name__, self.stringify()
+            "%s.parse: Done Parse. Plotting Recursion. Recurse=%r",
+            self.__class__.__name__,
+            parse_context.recurse,
         )
         if parse_context.may_recurse():
-            parse_context.logger.debug(parse_depth_msg)
+            # Only build the message if it will be logged. Stringifying at
+            # every depth of the parse is expensive.
+            if parse_context.logger.isEnabledFor(logging.DEBUG):
+                parse_context.logger.debug(
+                    "###\n#\n# Beginning Parse Depth {0}: {1}\n#\n###\nInitial Structure:\n{2}".format(
+                        parse_context.parse_depth + 1,
+                        self.__class__.__name__,
+                        self.stringify(),
+                    )
+                )
             with parse_context.deeper_parse() as ctx:
                 self.segments = self.expand(self.segments, parse_context=ctx)
         # Validate new segments
@@ -15,6 +15,8 @@ class Indent(RawSegment):
     be compared later.
     """
 
+    __slots__ = ()
+
     type = "indent"
     _is_code = False
     _template = "<unset>"
@@ -40,7 +42,7 @@ class Indent(RawSegment):
                 )
             )
         # Sorcery (but less to than on _ProtoKeywordSegment)
-        return type(cls.__name__, (cls,), dict(_config_rules=kwargs))
+        return type(cls.__name__, (cls,), dict(__slots__=(), _config_rules=kwargs))
 
     @classmethod
     def is_enabled(cls, parse_context):
@@ -89,6 +91,7 @@ class Indent(RawSegment):
         with repairs.
         """
         self._raw = ""
+        self._raw_upper = ""
         # TODO: Make sure that we DO actually skip meta segments
         # during fixes.
         self.pos_marker = pos_marker
@@ -105,4 +108,6 @@ class Dedent(Indent):
 
     """
 
+    __slots__ = ()
+
     indent_val = -1
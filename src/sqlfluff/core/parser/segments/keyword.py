@@ -36,6 +36,8 @@ class _ProtoKeywordSegment(RawSegment):
     may depend on later.
     """
 
+    __slots__ = ()
+
     type = "_proto_keyword"
     _is_code = True
     _template = "<unset>"
@@ -64,12 +66,17 @@ class _ProtoKeywordSegment(RawSegment):
 
         # We're only going to match against the first element
         if len(segments) >= 1:
-            raw = segments[0].raw
-            pos = segments[0].pos_marker
-            raw_comp = raw.upper()
-
-            if cls._template == raw_comp:
-                m = (cls(raw=raw, pos_marker=pos),)  # Return as a tuple
+            # NB: Use the uppercase raw cached on the segment, rather than
+            # upper-casing it again for every keyword we try against it.
+            if cls._template == segments[0].raw_upper:
+                # If this was already matched as one of us on a previous
+                # pass, it's exactly what we'd make, so don't make another.
+                if type(segments[0]) is cls:
+                    m = (segments[0],)
+                else:
+                    m = (
+                        cls(raw=segments[0].raw, pos_marker=segments[0].pos_marker),
+                    )  # Return as a tuple
                 return MatchResult(m, segments[1:])
         return MatchResult.from_unmatched(segments)
 
@@ -82,6 +89,8 @@ class KeywordSegment(_ProtoKeywordSegment):
     but don't end up being labelled as a `keyword` later.
     """
 
+    __slots__ = ()
+
     type = "keyword"
 
 
@@ -93,6 +102,8 @@ class SymbolSegment(_ProtoKeywordSegment):
     but don't end up being labelled as a `keyword` later.
     """
 
+    __slots__ = ()
+
     type = "symbol"
 
 
@@ -103,6 +114,8 @@ class ReSegment(_ProtoKeywordSegment):
     and so the `_ProtoKeywordSegment` should be used instead wherever possible.
     """
 
+    __slots__ = ()
+
     _anti_template = None
     """If `_anti_template` is set, then we exclude anything that matches it."""
 
@@ -126,11 +139,15 @@ class ReSegment(_ProtoKeywordSegment):
         # If we've been passed the singular, make it a list
         if isinstance(segments, BaseSegment):
             segments = [segments]
+        # If this was already matched as one of us on a previous pass, then
+        # it will match again, so skip the regexes.
+        if type(segments[0]) is cls:
+            return MatchResult((segments[0],), segments[1:])
         # Regardless of what we're passed, make a string.
         # NB: We only match on the first element of a set of segments.
         s = segments[0].raw
         # Case sensitivity is not supported
-        sc = s.upper()
+        sc = segments[0].raw_upper
         if len(s) == 0:
             raise ValueError("Zero length string passed to ReSegment!?")
         # Try the regex
@@ -157,6 +174,8 @@ class NamedSegment(_ProtoKeywordSegment):
     is largely identified by the Lexer.
     """
 
+    __slots__ = ()
+
     @classmethod
     def simple(cls, parse_context: ParseContext) -> Optional[List[str]]:
         """Does this matcher support a uppercase hash matching route?
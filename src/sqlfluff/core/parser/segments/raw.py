@@ -4,17 +4,45 @@ This is designed to be the root segment, without
 any children, and the output of the lexer.
 """
 
+import sys
+from typing import Dict, Tuple
+
 from .base import BaseSegment
 
+# Classes rebuilt when unpickling segments, so that each one is only made once.
+_rebuilt_classes: Dict[Tuple[type, str, str], type] = {}
+
+
+def _is_importable(cls):
+    """Is this class available by name from its module (and so picklable)?"""
+    module = sys.modules.get(cls.__module__)
+    return getattr(module, cls.__qualname__, None) is cls
+
+
+def _rebuild_segment(base, name, attrs):
+    """Create an empty segment of a rebuilt class, for unpickling.
+
+    See `RawSegment.__reduce_ex__`.
+    """
+    key = (base, name, repr(attrs))
+    cls = _rebuilt_classes.get(key)
+    if cls is None:
+        cls = _rebuilt_classes[key] = type(name, (base,), dict(attrs, __slots__=()))
+    return cls.__new__(cls)
+
 
 class RawSegment(BaseSegment):
     """This is a segment without any subsegments."""
 
+    # Raw segments are the most numerous objects in a parse, so use
+    # __slots__ rather than giving each one a __dict__. NB: Subclasses
+    # should declare empty __slots__ too, or they'll get one back.
+    __slots__ = ("_raw", "_raw_upper", "pos_marker")
+
     type = "raw"
     _is_code = False
     _is_comment = False
     _template = "<unset>"
-    _raw_upper = None
 
     def __init__(self, raw, pos_marker):
         self._raw = raw
@@ -49,6 +77,11 @@ class RawSegment(BaseSegment):
         """Return True if this segment is a comment."""
         return self._is_comment
 
+    @property
+    def raw(self):
+        """Return the raw content of this segment."""
+        return self._raw
+
     @property
     def raw_upper(self):
         """Make an uppercase string from the segments of this segment."""
@@ -80,13 +113,44 @@ class RawSegment(BaseSegment):
         newclass = type(
             classname,
             (cls,),
-            dict(_template=_template, _name=name, **kwargs),
+            dict(__slots__=(), _template=_template, _name=name, **kwargs),
         )
         # Now we return that class in the abstract. NOT INSTANTIATED
         return newclass
 
     # ################ INSTANCE METHODS
 
+    def __reduce_ex__(self, protocol):
+        """Allow segments of classes generated with `make` to be pickled.
+
+        Generated classes can't be found by name, so instead we pickle
+        the nearest importable parent class, along with the attributes
+        which the generated classes added to it.
+        """
+        cls = self.__class__
+        if _is_importable(cls):
+            return super().__reduce_ex__(protocol)
+        attrs = {}
+        for generated_cls in cls.__mro__:
+            if _is_importable(generated_cls):
+                break
+            for key, value in vars(generated_cls).items():
+                if not key.startswith("__"):
+                    # Attributes from subclasses take precedence.
+                    attrs.setdefault(key, value)
+        # Most of the state is in the slots, but subclasses which don't
+        # declare __slots__ will also have a __dict__.
+        slot_state = {
+            key: getattr(self, key)
+            for key in RawSegment.__slots__
+            if hasattr(self, key)
+        }
+        return (
+            _rebuild_segment,
+            (generated_cls, cls.__name__, tuple(sorted(attrs.items()))),
+            (getattr(self, "__dict__", None), slot_state),
+        )
+
     def iter_raw_seg(self):
         """Iterate raw segments, mostly for searching."""
         yield self
@@ -111,10 +175,6 @@ class RawSegment(BaseSegment):
             return raw_buff
         return raw_buff
 
-    def raw_list(self):
-        """Return a list of the raw content of this segment."""
-        return [self.raw]
-
     def _reconstruct(self):
         """Return a string of the raw content of this segment."""
         return self._raw
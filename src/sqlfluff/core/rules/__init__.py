@@ -1,7 +1,7 @@
 """init py for the new rules crawlers."""
 
 from .std import std_rule_set
-from .base import rules_logger  # noqa
+from .base import rules_logger, crawl_rules  # noqa
 
 
 def get_ruleset(name="standard"):
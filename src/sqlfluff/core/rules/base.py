@@ -272,7 +272,38 @@ class BaseCrawler:
             memory=memory,
             dialect=dialect,
         )
+        memory = self._process_result(res, vs, fixes, memory)
 
+        # The raw stack only keeps track of the previous raw segments
+        if len(segment.segments) == 0:
+            raw_stack += (segment,)
+        # Parent stack keeps track of all the parent segments
+        parent_stack += (segment,)
+
+        for idx, child in enumerate(segment.segments):
+            dvs, raw_stack, child_fixes, memory = self.crawl(
+                segment=child,
+                parent_stack=parent_stack,
+                siblings_pre=segment.segments[:idx],
+                siblings_post=segment.segments[idx + 1 :],
+                raw_stack=raw_stack,
+                fix=fix,
+                memory=memory,
+                dialect=dialect,
+            )
+            vs += dvs
+            fixes += child_fixes
+        return vs, raw_stack, fixes, memory
+
+    def _process_result(self, res, vs, fixes, memory):
+        """Extract the violations and fixes from the result of `_eval`.
+
+        Violations and fixes are appended to `vs` and `fixes`.
+
+        Returns:
+            The memory to carry forward to the next evaluation.
+
+        """
         if res is None:
             # Assume this means no problems (also means no memory)
             pass
@@ -300,27 +331,7 @@ class BaseCrawler:
                     res, self.code
                 )
             )
-
-        # The raw stack only keeps track of the previous raw segments
-        if len(segment.segments) == 0:
-            raw_stack += (segment,)
-        # Parent stack keeps track of all the parent segments
-        parent_stack += (segment,)
-
-        for idx, child in enumerate(segment.segments):
-            dvs, raw_stack, child_fixes, memory = self.crawl(
-                segment=child,
-                parent_stack=parent_stack,
-                siblings_pre=segment.segments[:idx],
-                siblings_post=segment.segments[idx + 1 :],
-                raw_stack=raw_stack,
-                fix=fix,
-                memory=memory,
-                dialect=dialect,
-            )
-            vs += dvs
-            fixes += child_fixes
-        return vs, raw_stack, fixes, memory
+        return memory
 
     # HELPER METHODS --------
 
@@ -384,6 +395,73 @@ class BaseCrawler:
         return kws(raw=raw, pos_marker=pos_marker)
 
 
+def crawl_rules(rules, segment, dialect):
+    """Crawl a segment once, evaluating several rules as we go.
+
+    This gives the same violations as calling :meth:`BaseCrawler.crawl`
+    on each rule in turn, but only walks the tree once. Each rule keeps
+    its own memory and raw stack. Fixes aren't collected, so this is only
+    suitable for linting.
+
+    Returns:
+        :obj:`list` of :obj:`SQLLintError`, ordered by rule and then
+        by position in the tree.
+
+    """
+    rule_vs = [[] for _ in rules]
+    memories = [None for _ in rules]
+    raw_stacks = [() for _ in rules]
+
+    def _crawl(segment, active, parent_stack, siblings_pre, siblings_post):
+        # Drop any rules which don't operate on unparsable sections. They
+        # skip the whole of this segment, including its children.
+        if segment.is_type("unparsable"):
+            active = [idx for idx in active if rules[idx]._works_on_unparsable]
+
+        for idx in active:
+            rule = rules[idx]
+            memory = memories[idx] or {}
+            res = rule._eval(
+                segment=segment,
+                parent_stack=parent_stack,
+                siblings_pre=siblings_pre,
+                siblings_post=siblings_post,
+                raw_stack=raw_stacks[idx],
+                memory=memory,
+                dialect=dialect,
+            )
+            memories[idx] = rule._process_result(res, rule_vs[idx], [], memory)
+
+        # The raw stack only keeps track of the previous raw segments.
+        # Rules which have skipped an unparsable segment have a different
+        # raw stack to the rest, so we extend each distinct stack once.
+        if len(segment.segments) == 0:
+            extended = []
+            for idx in active:
+                raw_stack = raw_stacks[idx]
+                for old_stack, new_stack in extended:
+                    if old_stack is raw_stack:
+                        break
+                else:
+                    new_stack = raw_stack + (segment,)
+                    extended.append((raw_stack, new_stack))
+                raw_stacks[idx] = new_stack
+        # Parent stack keeps track of all the parent segments
+        parent_stack += (segment,)
+
+        for idx, child in enumerate(segment.segments):
+            _crawl(
+                child,
+                active,
+                parent_stack,
+                segment.segments[:idx],
+                segment.segments[idx + 1 :],
+            )
+
+    _crawl(segment, list(range(len(rules))), (), (), ())
+    return [v for vs in rule_vs for v in vs]
+
+
 class RuleSet:
     """Class to define a ruleset.
 
@@ -2,7 +2,12 @@
 
 import os.path
 import ast
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
+from string import Formatter
+from types import CodeType, MappingProxyType
+from typing import Dict, Tuple
 
 from jinja2.sandbox import SandboxedEnvironment
 from jinja2 import meta
@@ -14,6 +19,31 @@ from .parser import FilePositionMarker
 _templater_lookup: Dict[str, "RawTemplateInterface"] = {}
 
 
+class ThisEmulator:
+    """A class which emulates the `this` class from dbt."""
+
+    name = "this_model"
+    schema = "this_schema"
+    database = "this_database"
+
+    def __str__(self):
+        return self.name
+
+
+# The dbt builtins which are injected in the context by the jinja templater.
+# This feels a bit wrong defining these here, they should probably
+# be configurable somewhere sensible. But for now they're not.
+# TODO: Come up with a better solution.
+_dbt_builtins = {
+    # `is_incremental()` renders as False, always in this case.
+    # TODO: This means we'll never parse the other part of the query,
+    # so we should find a solution to that. Perhaps forcing the file
+    # to be parsed TWICE if it uses this variable.
+    "is_incremental": lambda: False,
+    "this": ThisEmulator(),
+}
+
+
 def templater_selector(s=None, **kwargs):
     """Instantitate a new templater by name."""
     s = s or "jinja"  # default to jinja
@@ -98,23 +128,54 @@ class PythonTemplateInterface(RawTemplateInterface):
     """
 
     name = "python"
+    # Shared by every instance, so read only.
+    default_context = MappingProxyType(dict(test_value="__test__"))
 
     def __init__(self, override_context=None, **kwargs):
-        self.default_context = dict(test_value="__test__")
         self.override_context = override_context or {}
 
     @staticmethod
-    def infer_type(s):
+    @lru_cache(maxsize=1024)
+    def _literal_eval(s):
+        """Evaluate a string as a python literal, caching the result."""
+        try:
+            return ast.literal_eval(s)
+        except (SyntaxError, ValueError):
+            return s
+
+    @classmethod
+    def infer_type(cls, s):
         """Infer a python type from a string ans convert.
 
         Given a string value, convert it to a more specific built-in Python type
         (e.g. int, float, list, dictionary) if possible.
 
         """
-        try:
-            return ast.literal_eval(s)
-        except (SyntaxError, ValueError):
+        if not isinstance(s, str):
+            # Only strings can be evaluated.
             return s
+        # The same values come up for every file, so the evaluation is cached.
+        # NB: We copy the result so that no file can change the value which
+        # is passed to the next one.
+        return deepcopy(cls._literal_eval(s))
+
+    @staticmethod
+    def _undefined_fields(in_str, context):
+        """Get the names of any fields in a format string missing from the context.
+
+        NB: Only the top level named fields are checked. Anything else is
+        left for `str.format_map` to deal with.
+        """
+        undefined = set()
+        for _, field_name, _, _ in Formatter().parse(in_str):
+            if not field_name:
+                continue
+            # Attribute access and indexing (e.g. `{a.b}` or `{a[0]}`) are
+            # applied to the named field.
+            name = field_name.partition(".")[0].partition("[")[0]
+            if name and not name.isdigit() and name not in context:
+                undefined.add(name)
+        return undefined
 
     def get_context(self, fname=None, config=None):
         """Get the templating context from the config."""
@@ -128,10 +189,11 @@ class PythonTemplateInterface(RawTemplateInterface):
             )
         else:
             loaded_context = {}
-        live_context = {}
-        live_context.update(self.default_context)
-        live_context.update(loaded_context)
-        live_context.update(self.override_context)
+        live_context = {
+            **self.default_context,
+            **loaded_context,
+            **self.override_context,
+        }
 
         # Infer types
         for k in loaded_context:
@@ -150,8 +212,20 @@ class PythonTemplateInterface(RawTemplateInterface):
 
         """
         live_context = self.get_context(fname=fname, config=config)
+        # Check for any undefined variables up front, so we don't do the work
+        # of formatting only to fail part way through.
+        undefined_variables = self._undefined_fields(in_str, live_context)
+        if undefined_variables:
+            # TODO: Add a url here so people can get more help.
+            raise SQLTemplaterError(
+                "Failure in Python templating: {0}. Have you configured your variables?".format(
+                    ", ".join(repr(name) for name in sorted(undefined_variables))
+                )
+            )
         try:
-            return in_str.format(**live_context), []
+            # NB: format_map uses the context directly, rather than
+            # unpacking it into a new dict of keyword arguments.
+            return in_str.format_map(live_context), []
         except KeyError as err:
             # TODO: Add a url here so people can get more help.
             raise SQLTemplaterError(
@@ -169,10 +243,40 @@ class JinjaTemplateInterface(PythonTemplateInterface):
     """
 
     name = "jinja"
+    # The environment is stateless between files, so we build it once and share
+    # it rather than constructing a new one for every call to `process()`.
+    _env = None
+    # Compiled macro files, keyed by path, along with their modification time.
+    # NB: The macros themselves depend on the context of the file being
+    # templated, so we cache the compiled code rather than the macros.
+    _macro_code_cache: Dict[str, Tuple[int, CodeType]] = {}
+    # Compiled macros from config, keyed by their source.
+    _macro_source_cache: Dict[str, CodeType] = {}
+
+    @classmethod
+    def _get_jinja_env(cls):
+        """Get the (shared) jinja environment, building it if necessary."""
+        if cls._env is None:
+            # We explicitly want to preserve newlines.
+            cls._env = SandboxedEnvironment(
+                keep_trailing_newline=True,
+                # The do extension allows the "do" directive
+                autoescape=False,
+                extensions=["jinja2.ext.do"],
+            )
+        return cls._env
+
+    @classmethod
+    def _extract_macros_from_template(cls, template, env, ctx):
+        """Take a template string and extract any macros from it."""
+        code = cls._macro_source_cache.get(template)
+        if code is None:
+            code = cls._macro_source_cache[template] = env.compile(template)
+        return cls._extract_macros_from_code(code, env=env, ctx=ctx)
 
     @staticmethod
-    def _extract_macros_from_template(template, env, ctx):
-        """Take a template string and extract any macros from it.
+    def _extract_macros_from_code(code, env, ctx):
+        """Take a compiled template and extract any macros from it.
 
         Lovingly inspired by http://codyaray.com/2015/05/auto-load-jinja2-macros
         """
@@ -180,7 +284,7 @@ class JinjaTemplateInterface(PythonTemplateInterface):
 
         # Iterate through keys exported from the loaded template string
         context = {}
-        macro_template = env.from_string(template, globals=ctx)
+        macro_template = env.template_class.from_code(env, code, env.make_globals(ctx))
         # This is kind of low level and hacky but it works
         for k in macro_template.module.__dict__:
             attr = getattr(macro_template.module, k)
@@ -190,6 +294,36 @@ class JinjaTemplateInterface(PythonTemplateInterface):
         # Return the context
         return context
 
+    @staticmethod
+    def _read_file(path):
+        """Read the contents of a file."""
+        with open(path, "r") as opened_file:
+            return opened_file.read()
+
+    @classmethod
+    def _compile_macro_files(cls, paths, env):
+        """Get the compiled code for a list of macro file paths.
+
+        We only read and compile the files which have changed since we last
+        saw them. Reading the files is the slow part, so if there are several
+        to load then they're read in parallel. The compiling stays on this
+        thread.
+        """
+        stale = {}
+        for path in paths:
+            mtime = os.stat(path).st_mtime_ns
+            cached = cls._macro_code_cache.get(path)
+            if not cached or cached[0] != mtime:
+                stale[path] = mtime
+        if len(stale) > 1:
+            with ThreadPoolExecutor() as executor:
+                sources = list(executor.map(cls._read_file, stale))
+        else:
+            sources = [cls._read_file(path) for path in stale]
+        for (path, mtime), source in zip(stale.items(), sources):
+            cls._macro_code_cache[path] = (mtime, env.compile(source))
+        return [cls._macro_code_cache[path][1] for path in paths]
+
     @classmethod
     def _extract_macros_from_path(cls, path, env, ctx):
         """Take a path and extract macros from it."""
@@ -197,27 +331,38 @@ class JinjaTemplateInterface(PythonTemplateInterface):
         if not os.path.exists(path):
             raise ValueError("Path does not exist: {0}".format(path))
 
-        macro_ctx = {}
         if os.path.isfile(path):
             # It's a file. Extract macros from it.
-            with open(path, "r") as opened_file:
-                template = opened_file.read()
-            # Update the context with macros from the file.
-            macro_ctx.update(
-                cls._extract_macros_from_template(template, env=env, ctx=ctx)
-            )
+            paths = [path]
         else:
-            # It's a directory. Iterate through files in it and extract from them.
-            for dirpath, _, files in os.walk(path):
-                for fname in files:
-                    if fname.endswith(".sql"):
-                        macro_ctx.update(
-                            cls._extract_macros_from_path(
-                                os.path.join(dirpath, fname), env=env, ctx=ctx
-                            )
-                        )
+            # It's a directory. Extract macros from the files in it.
+            paths = list(cls._iter_macro_files(path))
+        macro_ctx = {}
+        for code in cls._compile_macro_files(paths, env=env):
+            macro_ctx.update(cls._extract_macros_from_code(code, env=env, ctx=ctx))
         return macro_ctx
 
+    @classmethod
+    def _iter_macro_files(cls, path):
+        """Iterate through the paths of the macro files in a directory.
+
+        Files in a directory are yielded before those in any of its
+        subdirectories, and symlinked directories aren't followed,
+        in the same way as `os.walk`.
+        """
+        subdirs = []
+        # Use the directory entries directly, rather than checking each
+        # path again with the os.path functions.
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(".sql"):
+                    yield entry.path
+        for subdir in subdirs:
+            yield from cls._iter_macro_files(subdir)
+
     def _extract_macros_from_config(self, config, env, ctx):
         """Take a config and load any macros from it."""
         if config:
@@ -237,53 +382,32 @@ class JinjaTemplateInterface(PythonTemplateInterface):
         return macro_ctx
 
     @staticmethod
-    def _generate_dbt_builtins():
-        """Generate the dbt builtins which are injected in the context."""
-        # This feels a bit wrong defining these here, they should probably
-        # be configurable somewhere sensible. But for now they're not.
-        # TODO: Come up with a better solution.
-
-        class ThisEmulator:
-            """A class which emulates the `this` class from dbt."""
-
-            name = "this_model"
-            schema = "this_schema"
-            database = "this_database"
-
-            def __str__(self):
-                return self.name
-
-        dbt_builtins = {
-            # `is_incremental()` renders as False, always in this case.
-            # TODO: This means we'll never parse the other part of the query,
-            # so we should find a solution to that. Perhaps forcing the file
-            # to be parsed TWICE if it uses this variable.
-            "is_incremental": lambda: False,
-            "this": ThisEmulator(),
-        }
-        return dbt_builtins
+    def _crawl_tree(tree, variable_names, raw_lines, line_offsets):
+        """Crawl the tree looking for occurances of the undeclared values.
 
-    @classmethod
-    def _crawl_tree(cls, tree, variable_names, raw):
-        """Crawl the tree looking for occurances of the undeclared values."""
-        # First iterate through children
-        for elem in tree.iter_child_nodes():
-            yield from cls._crawl_tree(elem, variable_names, raw)
-        # Then assess self
-        if isinstance(tree, jinja2.nodes.Name) and tree.name in variable_names:
-            line_no = tree.lineno
-            line = raw.split("\n")[line_no - 1]
-            pos = line.index(tree.name) + 1
-            # Generate the charpos. +1 is for the newline characters themselves
-            charpos = (
-                sum(len(raw_line) + 1 for raw_line in raw.split("\n")[: line_no - 1])
-                + pos
-            )
+        Args:
+            tree: The jinja syntax tree to crawl.
+            variable_names: The names of the undeclared variables.
+            raw_lines (:obj:`list` of :obj:`str`): The lines of the raw
+                template string.
+            line_offsets (:obj:`list` of :obj:`int`): The character offset
+                of the start of each line in the raw template string.
+
+        """
+        # Name nodes are leaves, so they come out in the same order here
+        # as they would from a depth first crawl.
+        for node in tree.find_all(jinja2.nodes.Name):
+            if node.name not in variable_names:
+                continue
+            line_no = node.lineno
+            pos = raw_lines[line_no - 1].index(node.name) + 1
+            # Generate the charpos from the offset of the start of the line.
+            charpos = line_offsets[line_no - 1] + pos
             # NB: The positions returned here will be *inconsistent* with those
             # from the linter at the moment, because these are references to the
             # structure of the file *before* templating.
             yield SQLTemplaterError(
-                "Undefined jinja template variable: {0!r}".format(tree.name),
+                "Undefined jinja template variable: {0!r}".format(node.name),
                 pos=FilePositionMarker(None, line_no, pos, charpos),
             )
 
@@ -298,13 +422,7 @@ class JinjaTemplateInterface(PythonTemplateInterface):
                 templating operation. Only necessary for some templaters.
 
         """
-        # We explicitly want to preserve newlines.
-        env = SandboxedEnvironment(
-            keep_trailing_newline=True,
-            # The do extension allows the "do" directive
-            autoescape=False,
-            extensions=["jinja2.ext.do"],
-        )
+        env = self._get_jinja_env()
 
         if not config:
             raise ValueError(
@@ -318,14 +436,10 @@ class JinjaTemplateInterface(PythonTemplateInterface):
             (self.templater_selector, self.name, "apply_dbt_builtins")
         )
         if apply_dbt_builtins:
-            # This feels a bit wrong defining these here, they should probably
-            # be configurable somewhere sensible. But for now they're not.
-            # TODO: Come up with a better solution.
-            dbt_builtins = self._generate_dbt_builtins()
-            for name in dbt_builtins:
+            for name in _dbt_builtins:
                 # Only apply if it hasn't already been set at this stage.
                 if name not in live_context:
-                    live_context[name] = dbt_builtins[name]
+                    live_context[name] = _dbt_builtins[name]
 
         # Load config macros
         ctx = self._extract_macros_from_config(config=config, env=env, ctx=live_context)
@@ -339,13 +453,24 @@ class JinjaTemplateInterface(PythonTemplateInterface):
             )
         live_context.update(ctx)
 
-        # Load the template, passing the global context.
-        template = env.from_string(in_str, globals=live_context)
+        # If there's nothing for jinja to do, then don't go to the trouble of
+        # parsing and rendering. NB: Jinja normalises newlines when rendering,
+        # so we don't take this route if there are any carriage returns.
+        if not any(tag in in_str for tag in ("{{", "{%", "{#", "\r")):
+            return in_str, []
+
+        # Parse the template once. The same syntax tree is used both to look
+        # for undeclared variables and to compile the template itself.
+        ast = env.parse(in_str)
+        # Load the template, passing the global context. This is what
+        # `env.from_string` would do, but without parsing the string again.
+        template = env.template_class.from_code(
+            env, env.compile(ast), env.make_globals(live_context)
+        )
         violations = []
 
         # Attempt to identify any undeclared variables
         try:
-            ast = env.parse(in_str)
             undefined_variables = meta.find_undeclared_variables(ast)
         except Exception as err:
             # TODO: Add a url here so people can get more help.
@@ -354,13 +479,19 @@ class JinjaTemplateInterface(PythonTemplateInterface):
             )
 
         # Get rid of any that *are* actually defined.
-        for val in live_context:
-            if val in undefined_variables:
-                undefined_variables.remove(val)
+        undefined_variables.difference_update(live_context)
 
         if undefined_variables:
+            # Work out where each line starts, so we can generate positions.
+            # +1 is for the newline characters themselves.
+            raw_lines = in_str.split("\n")
+            line_offsets = [0]
+            for raw_line in raw_lines[:-1]:
+                line_offsets.append(line_offsets[-1] + len(raw_line) + 1)
             # Lets go through and find out where they are:
-            for val in self._crawl_tree(ast, undefined_variables, in_str):
+            for val in self._crawl_tree(
+                ast, undefined_variables, raw_lines, line_offsets
+            ):
                 violations.append(val)
 
         try:
@@ -13,9 +13,11 @@ class SQLFluffViolationReporter(BaseViolationReporter):
     def __init__(self):
         """Calls the base class constructor to set the object's name."""
         super(SQLFluffViolationReporter, self).__init__("sqlfluff")
+        # The linter is only built when it's first needed, and then reused
+        # for every file that diff-quality asks about.
+        self._linter = None
 
-    @staticmethod
-    def violations(src_path):
+    def violations(self, src_path):
         """Return list of violations.
 
         Given the path to a .sql file, analyze it and return a list of
@@ -24,8 +26,9 @@ class SQLFluffViolationReporter(BaseViolationReporter):
         :param src_path:
         :return: list of Violation
         """
-        linter = Linter(config=FluffConfig.from_root())
-        linted_path = linter.lint_path(src_path, ignore_non_existent_files=True)
+        if self._linter is None:
+            self._linter = Linter(config=FluffConfig.from_root())
+        linted_path = self._linter.lint_path(src_path, ignore_non_existent_files=True)
         result = []
         for violation in linted_path.get_violations():
             try:
@@ -200,6 +200,17 @@ def test__cli__command_lint_stdin(command):
         ),
         # Check nofail works
         (lint, ["--nofail", "test/fixtures/linter/parse_lex_error.sql"]),
+        # Check linting in parallel
+        (
+            lint,
+            [
+                "-n",
+                "--parallel",
+                "2",
+                "test/fixtures/cli/passing_a.sql",
+                "test/fixtures/cli/passing_b.sql",
+            ],
+        ),
     ],
 )
 def test__cli__command_lint_parse(command):
@@ -1,6 +1,7 @@
 """Tests for the configuration routines."""
 
 import os
+import pickle
 
 from sqlfluff.core.config import ConfigLoader, nested_combine, dict_diff
 from sqlfluff.core import Linter, FluffConfig
@@ -123,3 +124,13 @@ def test__config__nested_config_tests():
             assert ("L003", 1, 4) in violations[k]
             assert "L002" not in [c[0] for c in violations[k]]
             assert "L009" not in [c[0] for c in violations[k]]
+
+
+def test__config__pickle():
+    """Test that configs survive pickling, reselecting the dialect."""
+    cfg = FluffConfig(overrides=dict(dialect="postgres", rules="L001"))
+    unpickled = pickle.loads(pickle.dumps(cfg))
+    assert unpickled.get("dialect_obj") is cfg.get("dialect_obj")
+    assert unpickled.get("templater_obj") == cfg.get("templater_obj")
+    assert unpickled.diff_to(cfg) == {}
+    assert unpickled.get("rule_whitelist") == ["L001"]
@@ -4,6 +4,7 @@ import pytest
 
 from sqlfluff.core import Linter, FluffConfig
 from sqlfluff.core.linter import LintingResult
+from sqlfluff.core.rules.base import BaseCrawler
 
 
 def normalise_paths(paths):
@@ -26,6 +27,18 @@ def test__linter__path_from_paths__dir():
     }
 
 
+def test__linter__path_from_paths__exts():
+    """Test files matching several extensions are only returned once."""
+    lntr = Linter(sql_exts=(".sql", "c.sql"))
+    paths = lntr.paths_from_path("test/fixtures/lexer")
+    assert len(paths) == 3
+    assert normalise_paths(paths) == {
+        "test.fixtures.lexer.block_comment.sql",
+        "test.fixtures.lexer.inline_comment.sql",
+        "test.fixtures.lexer.basic.sql",
+    }
+
+
 def test__linter__path_from_paths__file():
     """Test extracting paths from a file path."""
     lntr = Linter()
@@ -89,6 +102,17 @@ def test__linter__path_from_paths__ignore(path):
     }
 
 
+def test__linter__read_files():
+    """Test files read ahead are returned in order."""
+    lntr = Linter()
+    lntr.read_ahead = 2
+    fnames = lntr.paths_from_path("test/fixtures/linter")
+    assert len(fnames) > lntr.read_ahead
+    assert list(lntr._read_files(fnames)) == [
+        (fname, lntr._read_file(fname)) for fname in fnames
+    ]
+
+
 @pytest.mark.parametrize(
     "path",
     [
@@ -106,6 +130,113 @@ def test__linter__lint_string_vs_file(path):
     )
 
 
+@pytest.mark.parametrize("fix", [False, True])
+def test__linter__lint_paths_parallel(fix):
+    """Test linting in parallel gets the same results as in series."""
+    paths = [
+        "test/fixtures/linter/indentation_errors.sql",
+        "test/fixtures/linter/sqlfluffignore",
+        # Nested config files, and macros defined in the config.
+        "test/fixtures/config/inheritance_b",
+        "test/fixtures/templater/jinja_b",
+    ]
+    results = [
+        Linter().lint_paths(paths, fix=fix, parallel=parallel) for parallel in (1, 2)
+    ]
+    # Results should be in the same order, and have the same content.
+    for path, parallel_path in zip(results[0].paths, results[1].paths):
+        assert path.path == parallel_path.path
+        assert [f.path for f in path.files] == [f.path for f in parallel_path.files]
+        for file, parallel_file in zip(path.files, parallel_path.files):
+            assert [v.get_info_tuple() for v in file.violations] == [
+                v.get_info_tuple() for v in parallel_file.violations
+            ]
+            assert file.file_mask == parallel_file.file_mask
+            assert file.tree == parallel_file.tree
+
+
+def test__linter__get_ruleset_cached():
+    """Test the rules are only instantiated once for each config."""
+    lntr = Linter()
+    rules = lntr.get_ruleset()
+    assert lntr.get_ruleset() is rules
+    assert lntr.get_ruleset(config=lntr.config) is rules
+    # A different config gets its own rules.
+    cfg = FluffConfig(overrides=dict(rules="L001"))
+    assert [r.code for r in lntr.get_ruleset(config=cfg)] == ["L001"]
+
+
+def test__linter__parse_cache():
+    """Test parse results are reused for the same string and config."""
+    lntr = Linter()
+    sql = "SELECT a FROM b WHERE ===\n"
+    parsed, violations, _ = lntr.parse_string(sql)
+    cached, cached_violations, _ = lntr.parse_string(sql)
+    assert cached is parsed
+    assert [v.get_info_tuple() for v in cached_violations] == [
+        v.get_info_tuple() for v in violations
+    ]
+    # Violations can be marked as ignored, so they aren't shared.
+    assert cached_violations[0] is not violations[0]
+    # A different config gets a different parse.
+    cfg = FluffConfig(overrides=dict(dialect="bigquery"))
+    assert lntr.parse_string(sql, config=cfg)[0] is not parsed
+    # The cache doesn't hold on to the source strings.
+    assert all(sql not in key for key in lntr._parse_cache)
+
+
+def test__linter__parse_cache_size():
+    """Test the parse cache only keeps the most recently used parses."""
+    lntr = Linter()
+    lntr.parse_cache_size = 2
+    parsed = lntr.parse_string("SELECT 1\n")[0]
+    lntr.parse_string("SELECT 2\n")
+    # Using the first one again makes the second the oldest.
+    assert lntr.parse_string("SELECT 1\n")[0] is parsed
+    lntr.parse_string("SELECT 3\n")
+    assert len(lntr._parse_cache) == 2
+    assert lntr.parse_string("SELECT 1\n")[0] is parsed
+
+
+def test__linter__linting_result__violation_dict():
+    """Test the violations of several paths are combined by file."""
+    paths = [
+        "test/fixtures/linter/indentation_errors.sql",
+        "test/fixtures/linter/operator_errors.sql",
+    ]
+    result = Linter().lint_paths(paths)
+    violations = result.violation_dict()
+    assert sorted(violations) == paths
+    assert sum(len(v) for v in violations.values()) == result.num_violations()
+
+
+def test__linter__unparsable_description():
+    """Test the description of unparsable sections."""
+    _, violations, _ = Linter().parse_string("SELECT a FROM b WHERE ===\n")
+    assert len(violations) == 1
+    assert violations[0].desc() == "Found unparsable section: 'WHERE ==='"
+    assert str(violations[0]) == violations[0].desc()
+
+
+def test__linter__fix_skips_clean_rules(monkeypatch):
+    """Test rules aren't crawled again on a tree they found clean."""
+    crawled = []
+    crawl = BaseCrawler.crawl
+
+    def counting_crawl(self, segment, **kwargs):
+        # Only count the crawls of whole files, not the recursion.
+        if segment.is_type("file"):
+            crawled.append((self.code, segment))
+        return crawl(self, segment, **kwargs)
+
+    monkeypatch.setattr(BaseCrawler, "crawl", counting_crawl)
+    lntr = Linter(rules=["L001", "L006", "L010", "L014"])
+    linted = lntr.lint_string("SELECT 1  \nfrom tbl\n", fix=True)
+    assert linted.tree.raw == "SELECT 1\nFROM tbl\n"
+    # No rule should check the same tree twice.
+    assert len(crawled) == len({(code, id(tree)) for code, tree in crawled})
+
+
 def test__linter__linting_result__sum_dicts():
     """Test the summing of dictionaries in the linter."""
     lr = LintingResult()
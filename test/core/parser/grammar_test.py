@@ -3,9 +3,11 @@
 import pytest
 import logging
 
-from sqlfluff.core.parser import KeywordSegment
+from sqlfluff.core.parser import KeywordSegment, RawSegment
+from sqlfluff.core.parser.markers import FilePositionMarker
 from sqlfluff.core.parser.context import RootParseContext
-from sqlfluff.core.parser.segments import EphemeralSegment
+from sqlfluff.core.parser.match_result import MatchResult
+from sqlfluff.core.parser.segments import EphemeralSegment, Indent
 from sqlfluff.core.parser.grammar.base import BaseGrammar
 from sqlfluff.core.parser.grammar.noncode import NonCodeMatcher
 from sqlfluff.core.parser.grammar import (
@@ -16,6 +18,7 @@ from sqlfluff.core.parser.grammar import (
     StartsWith,
     Anything,
     Nothing,
+    Ref,
 )
 
 # NB: All of these tests depend somewhat on the KeywordSegment working as planned
@@ -102,6 +105,8 @@ def test__parser__grammar__base__longest_trimmed_match__adv(seg_list, caplog):
         (slice(None, None), ["bar", "foo"], slice(None, 1), "bar", None),
         # Look ahead for foo
         (slice(None, None), ["foo"], slice(2, 3), "foo", slice(None, 2)),
+        # The earliest match wins, regardless of the order of the matchers
+        (slice(None, None), ["foo", "bar"], slice(None, 1), "bar", None),
     ],
 )
 def test__parser__grammar__base__look_ahead_match(
@@ -150,6 +155,27 @@ def test__parser__grammar__base__look_ahead_match(
     assert result_match.matched_segments == expected_result
 
 
+def test__parser__grammar__base__look_ahead_match_stops(seg_list, monkeypatch):
+    """Test _look_ahead_match doesn't try matches beyond the first it finds."""
+    fs = KeywordSegment.make("foo")
+    bs = KeywordSegment.make("bar")
+    tried = []
+    match = fs.match.__func__
+
+    def logged_match(cls, segments, parse_context):
+        tried.append(segments[0].raw)
+        return match(cls, segments, parse_context)
+
+    monkeypatch.setattr(fs, "match", classmethod(logged_match))
+    with RootParseContext(dialect=None) as ctx:
+        _, result_match, result_matcher = BaseGrammar._look_ahead_match(
+            seg_list, [fs, bs], ctx
+        )
+    assert result_matcher is bs
+    assert result_match
+    assert tried == []
+
+
 def test__parser__grammar__base__ephemeral_segment(seg_list):
     """Test the ephemeral features BaseGrammar.
 
@@ -216,6 +242,23 @@ def test__parser__grammar_oneof(seg_list, allow_gaps):
         assert not g.match(seg_list[1:], parse_context=ctx)
 
 
+def test__parser__grammar_oneof_prune_options(seg_list):
+    """Test OneOf only tries the options which could match the first element."""
+    fs = KeywordSegment.make("foo")
+    bs = KeywordSegment.make("bar")
+    anything = Anything()
+    g = OneOf(fs, bs, anything)
+    with RootParseContext(dialect=None) as ctx:
+        opts = g._prune_options(seg_list, parse_context=ctx)
+        assert opts == [bs, anything]
+        # The options for a given first element are only worked out once.
+        assert g._prune_options(seg_list[:1], parse_context=ctx) is opts
+        # Leading whitespace is skipped.
+        assert g._prune_options(seg_list[1:], parse_context=ctx) == [fs, anything]
+        # Without any code, only the non-simple options are left.
+        assert g._prune_options(seg_list[1:2], parse_context=ctx) == [anything]
+
+
 def test__parser__grammar_oneof_exclude(seg_list):
     """Test the OneOf grammar exclude option."""
     fs = KeywordSegment.make("foo")
@@ -316,6 +359,39 @@ def test__parser__grammar_sequence_nested(seg_list, caplog):
             )
 
 
+def test__parser__grammar_sequence_flattened():
+    """Test plain nested Sequence and OneOf grammars are inlined."""
+    fs = KeywordSegment.make("foo")
+    bs = KeywordSegment.make("bar")
+    bas = KeywordSegment.make("baar")
+    assert Sequence(Sequence(bs, fs), bas)._elements == [bs, fs, bas]
+    assert OneOf(OneOf(bs, fs), bas)._elements == [bs, fs, bas]
+    # Anything which would change how the inner grammar matches is kept.
+    for inner in (
+        Sequence(bs, fs, optional=True),
+        Sequence(bs, fs, allow_gaps=False),
+        Sequence(bs, Indent, fs),
+        Sequence(Sequence(bs, optional=True), Sequence(fs, optional=True)),
+    ):
+        assert Sequence(inner, bas)._elements == [inner, bas]
+    inner = OneOf(bs, fs, exclude=bas)
+    assert OneOf(inner, bas)._elements == [inner, bas]
+
+
+def test__parser__grammar_sequence_dropped(seg_list):
+    """Test the Sequence grammar catches an element dropping segments."""
+
+    class DroppingGrammar(BaseGrammar):
+        def match(self, segments, parse_context):
+            # Match the first segment, and lose the rest.
+            return MatchResult.from_matched(segments[:1])
+
+    g = Sequence(DroppingGrammar())
+    with RootParseContext(dialect=None) as ctx:
+        with pytest.raises(RuntimeError):
+            g.match(seg_list, parse_context=ctx)
+
+
 @pytest.mark.parametrize(
     "token_list,min_delimiters,allow_gaps,allow_trailing,match_len",
     [
@@ -417,3 +493,42 @@ def test__parser__grammar_noncode(seg_list, fresh_ansi_dialect):
         m = NonCodeMatcher().match(seg_list[1:], parse_context=ctx)
     # We should match one and only one segment
     assert len(m) == 1
+
+
+def test__parser__grammar_ref_blacklist(seg_list, fresh_ansi_dialect):
+    """Test a failed Ref match is blacklisted for the same segments."""
+    g = Ref.keyword("select")
+    seg_tuple = tuple(id(seg) for seg in seg_list)
+    with RootParseContext(dialect=fresh_ansi_dialect) as ctx:
+        assert not ctx.blacklist.check("SelectKeywordSegment", seg_tuple)
+        assert not g.match(seg_list, parse_context=ctx)
+        assert ctx.blacklist.check("SelectKeywordSegment", seg_tuple)
+        # Different segments aren't blacklisted.
+        assert not ctx.blacklist.check("SelectKeywordSegment", seg_tuple[1:])
+
+
+def test__parser__grammar_ref_blacklist_short_lived():
+    """Test segments freed during a match don't give false blacklist hits."""
+    seg_cls = RawSegment.make("", _is_code=True)
+    with RootParseContext(dialect=None) as ctx:
+        segments = (seg_cls("foo", FilePositionMarker.from_fresh()),)
+        ctx.blacklist.mark("FooSegment", tuple(map(id, segments)), segments)
+        del segments
+        # A new segment can't take over the id of a blacklisted one.
+        segments = (seg_cls("foo", FilePositionMarker.from_fresh()),)
+        assert not ctx.blacklist.check("FooSegment", tuple(map(id, segments)))
+
+
+def test__parser__grammar_ref_match_cache(generate_test_segments, fresh_ansi_dialect):
+    """Test a successful Ref match is reused for the same segments."""
+    seg_list = generate_test_segments(["select", " ", "foo"])
+    g = Ref.keyword("select")
+    with RootParseContext(dialect=fresh_ansi_dialect) as ctx:
+        m = g.match(seg_list, parse_context=ctx)
+        assert m
+        assert g.match(seg_list, parse_context=ctx) is m
+        # Different segments are matched afresh.
+        assert not g.match(seg_list[1:], parse_context=ctx)
+        # Once cleared, we match again.
+        ctx.match_cache.clear()
+        assert g.match(seg_list, parse_context=ctx) is not m
@@ -38,6 +38,12 @@ def assert_matches(instring, matcher, matchstring):
         assert res.segments[0].raw == matchstring
 
 
+def test__parser__lexer_lexmatch_hashable():
+    """Test equal LexMatch objects hash the same, like a namedtuple."""
+    assert hash(LexMatch("a", None, ())) == hash(LexMatch("a", None, ()))
+    assert len({LexMatch("a", None, ()), LexMatch("a", None, ())}) == 1
+
+
 @pytest.mark.parametrize(
     "raw,res",
     [
@@ -69,6 +75,22 @@ def test__parser__lexer_obj(raw, res, caplog):
         assert [seg.raw for seg in lexing_segments] == res
 
 
+@pytest.mark.parametrize(
+    "raw,res",
+    [
+        ("a ?& b", ["a", " ", "?&", " ", "b"]),
+        ("a ?| b ? c", ["a", " ", "?|", " ", "b", " ", "?", " ", "c"]),
+        ("a->>'b'->'c'", ["a", "->>", "'b'", "->", "'c'"]),
+    ],
+)
+def test__parser__lexer_postgres_json_operators(raw, res):
+    """Test the postgres lexer matches the longest json operator."""
+    lex = Lexer(config=FluffConfig(overrides=dict(dialect="postgres")))
+    lexing_segments, vs = lex.lex(raw)
+    assert [seg.raw for seg in lexing_segments] == res
+    assert not vs
+
+
 @pytest.mark.parametrize(
     "raw,res",
     [
@@ -125,6 +147,19 @@ def test__parser__lexer_multimatcher(caplog):
         assert res.segments[2].raw == "#..#"
 
 
+def test__parser__lexer_multimatcher_empty_match(caplog):
+    """Test the RepeatedMultiMatcher skips earlier matchers which match empty."""
+    matcher = RepeatedMultiMatcher(
+        RegexMatcher("test", r"a*", RawSegment.make("test", name="test")),
+        SingletonMatcher("dot", ".", RawSegment.make(".", name="dot", is_code=True)),
+    )
+    start_pos = FilePositionMarker.from_fresh()
+    with caplog.at_level(logging.DEBUG):
+        res = matcher.match(".aa.#", start_pos)
+        assert res.new_string == "#"
+        assert [seg.raw for seg in res.segments] == [".", "aa", "."]
+
+
 def test__parser__lexer_fail():
     """Test the how the lexer fails and reports errors."""
     lex = Lexer(config=FluffConfig())
@@ -1,5 +1,7 @@
 """The Test file for The New Parser (Marker Classes)."""
 
+import pytest
+
 from sqlfluff.core.parser.markers import FilePositionMarker
 
 
@@ -20,8 +22,32 @@ def test__parser__common_marker():
     assert fp4 == FilePositionMarker(2, 3, 7, 17)
 
 
+@pytest.mark.parametrize(
+    "raw,res",
+    [
+        ("", (1, 1, 1, 0)),
+        ("\n", (1, 2, 1, 1)),
+        ("abc\n", (1, 2, 1, 4)),
+        ("\n\nab", (1, 3, 3, 4)),
+    ],
+)
+def test__parser__common_marker_advance(raw, res):
+    """Test advancing markers over newlines."""
+    assert FilePositionMarker.from_fresh().advance_by(raw) == FilePositionMarker(
+        *res
+    )
+
+
 def test__parser__common_marker_format():
     """Test formatting of markers."""
     fp1 = FilePositionMarker(1, 2, 3, 0)
     # Check Formatting Style
     assert str(fp1) == "[0](1, 2, 3)"
+
+
+def test__parser__common_marker_slots():
+    """Test markers don't carry an instance dict."""
+    fp1 = FilePositionMarker.from_fresh().advance_by("abc")
+    assert not hasattr(fp1, "__dict__")
+    with pytest.raises(AttributeError):
+        fp1.foo = "bar"
@@ -1,8 +1,11 @@
 """The Test file for The New Parser (MatchResult Classes)."""
 
+import logging
+
 import pytest
 
 from sqlfluff.core.parser.match_result import MatchResult
+from sqlfluff.core.parser.match_logging import is_match_logging
 from sqlfluff.core.parser import RawSegment, FilePositionMarker
 
 
@@ -59,3 +62,13 @@ def test__parser__match_add_raises(fail_case, raw_seg):
     # Test adding, and check we get an exception of the right type
     with pytest.raises(TypeError):
         m1 + fail_case
+
+
+def test__parser__is_match_logging():
+    """Test match logging is only enabled at the right verbosity."""
+    logger = logging.getLogger("sqlfluff.test.match_logging")
+    logger.setLevel(logging.INFO)
+    assert is_match_logging(logger, 3)
+    assert not is_match_logging(logger, 4)
+    # Other verbosity levels are never logged.
+    assert not is_match_logging(logger, 5)
@@ -1,11 +1,14 @@
 """The Test file for The New Parser (Base Segment Classes)."""
 
+import pickle
+
 import pytest
 
 from sqlfluff.core.parser import (
     FilePositionMarker,
     RawSegment,
     BaseSegment,
+    KeywordSegment,
 )
 from sqlfluff.core.parser.context import RootParseContext
 from sqlfluff.core.dialects import ansi_dialect
@@ -117,3 +120,28 @@ def test__parser__base_segments_base_compare():
     assert ds1 == ds2
     # Check a different match on the same details are not the same
     assert ds1 != dsa2
+
+
+def test__parser__base_segments_pickle(raw_seg):
+    """Test segments of generated classes survive pickling."""
+    select_kw = KeywordSegment.make("select")
+    kw = select_kw("SELECT", raw_seg.pos_marker.advance_by(raw_seg.raw))
+    ds = DummySegment([raw_seg, kw])
+    unpickled = pickle.loads(pickle.dumps(ds))
+    assert unpickled == ds
+    assert unpickled.segments[1].name == "SELECT"
+    assert unpickled.segments[1].is_type("keyword")
+    assert isinstance(unpickled.segments[1], KeywordSegment)
+    # Classes are only rebuilt once.
+    assert type(pickle.loads(pickle.dumps(kw))) is type(unpickled.segments[1])
+
+
+def test__parser__base_segments_raw_slots(raw_seg):
+    """Test raw segments, including generated ones, don't have a __dict__."""
+    kw = KeywordSegment.make("select")("SELECT", raw_seg.pos_marker)
+    for seg in (raw_seg, kw):
+        assert not hasattr(seg, "__dict__")
+    # Segments with children still do, for their cached properties.
+    ds = DummySegment([raw_seg])
+    assert ds.raw == "foobar"
+    assert "raw" in ds.__dict__
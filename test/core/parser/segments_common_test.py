@@ -47,6 +47,19 @@ def test__parser__core_keyword(raw_seg_list):
         assert FooKeyword.match(raw_seg_list[1:], parse_context=ctx)
 
 
+def test__parser__core_keyword_rematch(raw_seg_list):
+    """Test a keyword which has already been matched isn't made again."""
+    FooKeyword = KeywordSegment.make("foo")
+    with RootParseContext(dialect=None) as ctx:
+        kw = FooKeyword.match(raw_seg_list[1:], parse_context=ctx).matched_segments[0]
+        m = FooKeyword.match((kw,) + tuple(raw_seg_list[2:]), parse_context=ctx)
+        assert m.matched_segments[0] is kw
+        # A different keyword class with the same template still makes its own.
+        OtherFooKeyword = KeywordSegment.make("foo")
+        m = OtherFooKeyword.match((kw,), parse_context=ctx)
+        assert isinstance(m.matched_segments[0], OtherFooKeyword)
+
+
 def test__parser__core_ephemeral_segment(raw_seg_list):
     """Test the Mystical KeywordSegment."""
     # First make a keyword
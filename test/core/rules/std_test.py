@@ -3,7 +3,7 @@
 import pytest
 
 from sqlfluff.core import Linter, FluffConfig
-from sqlfluff.core.rules.base import BaseCrawler, LintResult, LintFix
+from sqlfluff.core.rules.base import BaseCrawler, LintResult, LintFix, crawl_rules
 from sqlfluff.core.rules.std import std_rule_set
 
 
@@ -824,6 +824,28 @@ def test__rules__std_file(rule, path, violations):
     assert set(lnt.check_tuples()) == {(rule, v[0], v[1]) for v in violations}
 
 
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT a  ,b\n    FROM tbl AS t\nWHERE a = 1\n",
+        # The WHERE clause is unparsable, so some rules skip it.
+        "SELECT a  ,b\nFROM tbl\nWHERE a ===   b\n    AND c\n",
+    ],
+)
+def test__rules__crawl_rules(sql):
+    """Test crawling all rules at once matches crawling each in turn."""
+    lntr = Linter()
+    parsed, _, _ = lntr.parse_string(sql)
+    rules = lntr.get_ruleset()
+    lerrs = []
+    for r in rules:
+        lerrs += r.crawl(parsed, dialect=lntr.dialect)[0]
+    assert lerrs
+    assert [v.get_info_tuple() for v in crawl_rules(rules, parsed, lntr.dialect)] == [
+        v.get_info_tuple() for v in lerrs
+    ]
+
+
 def test__rules__std_L003_process_raw_stack(generate_test_segments):
     """Test the _process_raw_stack function.
 
@@ -1,5 +1,7 @@
 """Tests for templaters."""
 
+import os
+
 import pytest
 
 from sqlfluff.core.templaters import (
@@ -40,6 +42,14 @@ def test__templater_python():
     assert outstr == "SELECT * FROM foo"
 
 
+def test__templater_python_default_context():
+    """Test the shared default context can't be changed by an instance."""
+    t = PythonTemplateInterface()
+    with pytest.raises(TypeError):
+        t.default_context["test_value"] = "foo"
+    assert PythonTemplateInterface().default_context["test_value"] == "__test__"
+
+
 def test__templater_python_error():
     """Test error handling in the python templater."""
     t = PythonTemplateInterface(override_context=dict(noblah="foo"))
@@ -48,6 +58,38 @@ def test__templater_python_error():
         t.process(instr)
 
 
+@pytest.mark.parametrize(
+    "instr,undefined",
+    [
+        ("SELECT * FROM {blah}", {"blah"}),
+        ("SELECT {a.b}, {c[0]} FROM {blah!r:>10}", {"a", "c", "blah"}),
+        ("SELECT {{blah}}, {noblah} FROM {0}", set()),
+    ],
+)
+def test__templater_python_undefined_fields(instr, undefined):
+    """Test finding undefined fields in the python templater."""
+    assert (
+        PythonTemplateInterface._undefined_fields(instr, dict(noblah="foo"))
+        == undefined
+    )
+
+
+@pytest.mark.parametrize(
+    "value,result",
+    [("1", 1), ("1.5", 1.5), ("[1, 2]", [1, 2]), ("foo", "foo"), (7, 7)],
+)
+def test__templater_python_infer_type(value, result):
+    """Test type inference of context values."""
+    assert PythonTemplateInterface.infer_type(value) == result
+
+
+def test__templater_python_infer_type_copies():
+    """Test that inferred values aren't shared between calls."""
+    first = PythonTemplateInterface.infer_type("[1, 2]")
+    first.append(3)
+    assert PythonTemplateInterface.infer_type("[1, 2]") == [1, 2]
+
+
 JINJA_STRING = "SELECT * FROM {% for c in blah %}{{c}}{% if not loop.last %}, {% endif %}{% endfor %} WHERE {{condition}}\n\n"
 
 
@@ -59,6 +101,32 @@ def test__templater_jinja():
     assert outstr == "SELECT * FROM f, o, o WHERE a < 10\n\n"
 
 
+def test__templater_jinja_shared_env():
+    """Test that the jinja environment is reused between files."""
+    t1 = JinjaTemplateInterface(override_context=dict(blah="foo", condition="a"))
+    t2 = JinjaTemplateInterface(override_context=dict(blah="bar", condition="b"))
+    outstr1, _ = t1.process(JINJA_STRING, config=FluffConfig())
+    outstr2, _ = t2.process(JINJA_STRING, config=FluffConfig())
+    assert t1._get_jinja_env() is t2._get_jinja_env()
+    # Context from one file mustn't leak into another.
+    assert outstr1 == "SELECT * FROM f, o, o WHERE a\n\n"
+    assert outstr2 == "SELECT * FROM b, a, r WHERE b\n\n"
+
+
+@pytest.mark.parametrize(
+    "instr,outstr",
+    [
+        ("SELECT {a} FROM tbl\n", "SELECT {a} FROM tbl\n"),
+        ("SELECT 1\r\nFROM tbl\r\n", "SELECT 1\nFROM tbl\n"),
+        ("SELECT 1 {# comment #}\n", "SELECT 1 \n"),
+    ],
+)
+def test__templater_jinja_untemplated(instr, outstr):
+    """Test jinja templating of strings without any jinja tags."""
+    t = JinjaTemplateInterface()
+    assert t.process(instr, config=FluffConfig()) == (outstr, [])
+
+
 def test__templater_jinja_error():
     """Test error handling in the jinja templater."""
     t = JinjaTemplateInterface(override_context=dict(blah="foo"))
@@ -69,6 +137,68 @@ def test__templater_jinja_error():
     assert len(vs) > 0
 
 
+def test__templater_jinja_error_positions():
+    """Test the positions of undefined variables in the jinja templater."""
+    t = JinjaTemplateInterface()
+    instr = "SELECT\n    {{ foo }}\nFROM {{bar}}\n"
+    _, vs = t.process(instr, config=FluffConfig())
+    assert [(v.pos.line_no, v.pos.line_pos, v.pos.char_pos) for v in vs] == [
+        (2, 8, 15),
+        (3, 8, 29),
+    ]
+    assert "'foo'" in str(vs[0])
+
+
+def test__templater_jinja_macro_path_cache(tmp_path):
+    """Test that macro files are reloaded only when they change."""
+    macro_file = tmp_path / "macros.sql"
+    macro_file.write_text("{% macro m() %}a{% endmacro %}")
+    cfg = FluffConfig(
+        configs={"templater": {"jinja": {"load_macros_from_path": str(macro_file)}}}
+    )
+    t = JinjaTemplateInterface()
+    outstr, _ = t.process("SELECT {{ m() }}\n", config=cfg)
+    assert outstr == "SELECT a\n"
+    assert str(macro_file) in t._macro_code_cache
+    # Change the file, and make sure the modification time moves on.
+    mtime = os.stat(macro_file).st_mtime_ns
+    macro_file.write_text("{% macro m() %}b{% endmacro %}")
+    os.utime(macro_file, ns=(mtime + 10**9, mtime + 10**9))
+    outstr, _ = t.process("SELECT {{ m() }}\n", config=cfg)
+    assert outstr == "SELECT b\n"
+
+
+def test__templater_jinja_macro_path_nested(tmp_path):
+    """Test that macros are loaded from subdirectories after the parent."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.sql").write_text("{% macro m() %}a{% endmacro %}")
+    (tmp_path / "sub" / "b.sql").write_text(
+        "{% macro m() %}b{% endmacro %}{% macro n() %}c{% endmacro %}"
+    )
+    (tmp_path / "ignored.txt").write_text("{% macro o() %}d{% endmacro %}")
+    cfg = FluffConfig(
+        configs={"templater": {"jinja": {"load_macros_from_path": str(tmp_path)}}}
+    )
+    outstr, vs = JinjaTemplateInterface().process(
+        "SELECT {{ m() }}, {{ n() }}\n", config=cfg
+    )
+    assert outstr == "SELECT b, c\n"
+    assert not vs
+
+
+def test__templater_jinja_config_macro_context():
+    """Test that cached config macros use the context of each file."""
+    macros = {"m": "{% macro m() %}{{ tbl }}{% endmacro %}"}
+    for tbl in ("a", "b"):
+        cfg = FluffConfig(
+            configs={
+                "templater": {"jinja": {"macros": macros, "context": {"tbl": tbl}}}
+            }
+        )
+        outstr, _ = JinjaTemplateInterface().process("SELECT {{ m() }}\n", config=cfg)
+        assert outstr == "SELECT {0}\n".format(tbl)
+
+
 def test__templater_jinja_error_catatrophic():
     """Test error handling in the jinja templater."""
     t = JinjaTemplateInterface(override_context=dict(blah=7))
@@ -36,3 +36,16 @@ def test_diff_quality_plugin(sql_path, expected_violations_lines):
             assert expected_line in violations_lines
     else:
         assert len(violations) == 0
+
+
+@pytest.mark.skipif(
+    sys.version_info[:2] == (3, 4),
+    reason="requires diff_cover package, which does not support python3.4",
+)
+def test_diff_quality_plugin_reuses_linter():
+    """Test the plugin only builds one linter for several files."""
+    violation_reporter = diff_quality_plugin.diff_cover_report_quality()
+    violation_reporter.violations("test/fixtures/linter/indentation_errors.sql")
+    linter = violation_reporter._linter
+    violation_reporter.violations("test/fixtures/linter/parse_error.sql")
+    assert violation_reporter._linter is linter